@@ -29,14 +29,24 @@ async def test_help_cog():
         if help_cog:
             print(f"✅ HelpCog registered: {help_cog}")
             
-            # Check if help command exists
-            help_cmd = bot.get_command('help')
+            # Check if help command exists (registered as `helpmenu`, `/help` on the tree)
+            help_cmd = bot.get_command('helpmenu')
             if help_cmd:
                 print(f"✅ Help command registered: {help_cmd}")
             else:
                 print("❌ Help command not found!")
+                return False
+
+            # The cog must be the dropdown implementation
+            view = help_module.HelpView(bot, author_id=0)
+            if any(isinstance(item, help_module.HelpSelect) for item in view.children):
+                print("✅ Dropdown help menu builds")
+            else:
+                print("❌ Dropdown help menu missing!")
+                return False
         else:
             print("❌ HelpCog not registered!")
+            return False
             
     except Exception as e:
         print(f"❌ Failed to load help cog: {e}")
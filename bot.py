@@ -15,9 +15,12 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from models import Base
+from utils.bet_logger import BetLogger
 from utils.config import Config
 
 # Load environment variables
@@ -34,6 +37,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Applied to every new SQLite connection: WAL lets readers run alongside the writer,
+# and NORMAL sync is durable enough under WAL while avoiding an fsync per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Engine connect hook that tunes each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def create_schema(connection):
+    """Create missing tables, and indexes added to tables that already exist.
+
+    create_all only creates a table's indexes along with the table itself.
+    """
+    Base.metadata.create_all(connection)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def engine_options(config: Config) -> dict:
+    """Pool settings for the configured database URL."""
+    url = make_url(config.database_url)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        # In-memory SQLite uses a single static connection; pool sizing doesn't apply
+        return {}
+    options = {
+        'pool_size': config.db_pool_size,
+        'max_overflow': config.db_max_overflow,
+        'pool_pre_ping': True,
+        'pool_recycle': config.db_pool_recycle,
+    }
+    if url.get_backend_name() == 'postgresql' and url.get_driver_name() == 'asyncpg':
+        # Keep prepared statements per connection so repeat queries skip parse/plan
+        options['connect_args'] = {'prepared_statement_cache_size': config.db_statement_cache_size}
+    return options
+
+
 class Fun2OoshBot(commands.Bot):
     """Main bot class for fun2oosh."""
 
@@ -51,10 +101,18 @@ class Fun2OoshBot(commands.Bot):
         )
 
         self.config = config
-        self.engine = create_async_engine(config.database_url, echo=False)
+        self.engine = create_async_engine(
+            config.database_url,
+            echo=False,
+            query_cache_size=config.db_query_cache_size,
+            **engine_options(config)
+        )
+        if self.engine.dialect.name == 'sqlite':
+            event.listen(self.engine.sync_engine, 'connect', _set_sqlite_pragmas)
         self.async_session_maker = async_sessionmaker(
             self.engine, expire_on_commit=False
         )
+        self.bet_logger = BetLogger(self.async_session_maker)
         # Discover available cog modules from the cogs directory
         from pathlib import Path
         cogs_dir = Path(__file__).resolve().parent / 'cogs'
@@ -69,11 +127,25 @@ class Fun2OoshBot(commands.Bot):
         """Get a database session."""
         return self.async_session_maker()
 
+    async def warm_pool(self):
+        """Open the pool's connections up front so the first burst of commands doesn't pay to connect."""
+        pool_size = engine_options(self.config).get('pool_size', 0)
+        if not pool_size:
+            return
+        connections = await asyncio.gather(*(self.engine.connect() for _ in range(pool_size)))
+        for connection in connections:
+            await connection.close()
+        logger.info(f"Warmed database pool with {pool_size} connections")
+
     async def setup_hook(self) -> None:
         """Setup hook called before the bot starts."""
         # Create database tables
         async with self.engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(create_schema)
+        await self.warm_pool()
+
+        # Start the batched Bet writer
+        self.bet_logger.start()
 
         # Load core cogs
         core_cogs = [
@@ -152,6 +224,11 @@ class Fun2OoshBot(commands.Bot):
         tree_commands = self.tree.get_commands()
         logger.info(f"🌲 Command tree contains {len(tree_commands)} commands")
 
+    async def close(self):
+        """Flush queued bets before shutting down."""
+        await self.bet_logger.close()
+        await super().close()
+
     async def on_ready(self):
         """Called when the bot is ready."""
         if self.user:
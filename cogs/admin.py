@@ -48,7 +48,7 @@ class Admin(commands.Cog):
 
     @app_commands.command(name='add_money', description='Add money to a user (admin only)')
     @app_commands.describe(user='User to add money to', amount='Amount to add')
-    async def add_money_slash(self, interaction: discord.Interaction, user: discord.User, amount: int):
+    async def add_money_slash(self, interaction: discord.Interaction, user: discord.User, amount: app_commands.Range[int, 1]):
         """Slash command for adding money."""
         is_owner = interaction.user.id == self.config.owner_id
         is_admin = False
@@ -122,6 +122,7 @@ class Admin(commands.Cog):
                     await session.execute(text("DELETE FROM transactions")) 
                     await session.execute(text("DELETE FROM wallets"))
                     await session.commit()
+                EconomyUtils.invalidate_profile()
                 
                 embed = EmbedBuilder.success_embed(
                     "✅ Economy Reset Complete",
@@ -167,6 +168,7 @@ class Admin(commands.Cog):
             await session.execute(text("DELETE FROM transactions")) 
             await session.execute(text("DELETE FROM wallets"))
             await session.commit()
+        EconomyUtils.invalidate_profile()
         
         embed = EmbedBuilder.success_embed(
             "✅ Economy Reset Complete",
@@ -29,6 +29,7 @@ from utils.config import Config
 from utils.economy_utils import EconomyUtils
 from utils.cooldowns import cooldown_manager
 from utils.anti_fraud import anti_fraud as anti_fraud_instance
+from utils.helpers import format_coins
 
 
 class CardSuit(Enum):
@@ -42,6 +43,8 @@ class CardSuit(Enum):
 class Card:
     """Represents a playing card."""
     
+    __slots__ = ('rank', 'suit')
+    
     def __init__(self, rank: str, suit: CardSuit):
         self.rank = rank
         self.suit = suit
@@ -66,6 +69,8 @@ class Card:
 class Deck:
     """Represents a deck of cards."""
     
+    __slots__ = ('cards', 'num_decks')
+    
     RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
     
     def __init__(self, num_decks: int = 1):
@@ -94,6 +99,8 @@ class Deck:
 class BlackjackHand:
     """Represents a blackjack hand."""
     
+    __slots__ = ('cards', 'bet', 'stand', 'busted', 'doubled')
+    
     def __init__(self, bet: int, cards: Optional[List[Card]] = None):
         self.cards = cards or []
         self.bet = bet
@@ -436,6 +443,22 @@ class BlackjackGame:
             await self.check_winner(interaction)
 
 
+# Roulette bet parsing and win checks
+ROULETTE_BET_TYPES = ('number', 'red', 'black', 'odd', 'even', 'low', 'high')
+_ROULETTE_BET_SET = frozenset(ROULETTE_BET_TYPES)
+_ROULETTE_INVALID_TYPE = f"❌ Invalid bet type! Choose from: {', '.join(ROULETTE_BET_TYPES)}"
+_ROULETTE_NUMBERS = frozenset(str(i) for i in range(37))
+_RED_NUMBERS = frozenset({1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36})
+_ROULETTE_CHECKS = {
+    'red': lambda n: n in _RED_NUMBERS,
+    'black': lambda n: n != 0 and n not in _RED_NUMBERS,
+    'odd': lambda n: n % 2 == 1,
+    'even': lambda n: n != 0 and n % 2 == 0,
+    'low': lambda n: 1 <= n <= 18,
+    'high': lambda n: 19 <= n <= 36,
+}
+
+
 class RouletteView(discord.ui.View):
     """Interactive view for roulette betting."""
     
@@ -464,66 +487,126 @@ class RouletteView(discord.ui.View):
 
 
 class SlotMachine:
-    """Slot machine game logic."""
+    """Slot machine game logic.
     
-    SYMBOLS = ['🍒', '🍋', '🍊', '🍇', '🔔', '⭐', '💎', '7️⃣']
+    Reels are symbol ids (indexes into SYMBOLS); emoji are only looked up when rendering.
+    """
     
-    # Payout multipliers
-    PAYOUTS = {
-        '💎': 50,   # Diamond - highest
-        '7️⃣': 30,   # Seven
-        '⭐': 20,   # Star
-        '🔔': 15,   # Bell
-        '🍇': 10,   # Grapes
-        '🍊': 8,    # Orange
-        '🍋': 5,    # Lemon
-        '🍒': 3,    # Cherry - lowest
-    }
+    SYMBOLS = ('🍒', '🍋', '🍊', '🍇', '🔔', '⭐', '💎', '7️⃣')
+    SYMBOL_IDS = tuple(range(len(SYMBOLS)))
+    
+    # Payout multipliers, indexed by symbol id
+    PAYOUTS = (
+        3,    # Cherry - lowest
+        5,    # Lemon
+        8,    # Orange
+        10,   # Grapes
+        15,   # Bell
+        20,   # Star
+        50,   # Diamond - highest
+        30,   # Seven
+    )
+    
+    # Weight probabilities (lower index = higher chance), indexed by symbol id
+    WEIGHTS = (30, 25, 20, 15, 10, 8, 5, 2)
     
     @classmethod
-    def spin(cls) -> Tuple[List[str], int, str]:
-        """Spin the slot machine. Returns (symbols, multiplier, result_text)."""
-        # Weight probabilities (lower index = higher chance)
-        weights = [30, 25, 20, 15, 10, 8, 5, 2]  # Matches SYMBOLS order
+    def spin(cls) -> Tuple[List[int], int]:
+        """Spin the slot machine. Returns (symbol ids, multiplier)."""
+        reels = random.choices(cls.SYMBOL_IDS, weights=cls.WEIGHTS, k=3)
+        a, b, c = reels
         
-        reels = [
-            random.choices(cls.SYMBOLS, weights=weights)[0]
-            for _ in range(3)
-        ]
-        
-        # Check for wins
-        if reels[0] == reels[1] == reels[2]:
+        if a == b == c:
             # Three of a kind
-            symbol = reels[0]
-            multiplier = cls.PAYOUTS[symbol]
-            result = f"🎰 **JACKPOT!** Three {symbol}!"
-        elif reels[0] == reels[1] or reels[1] == reels[2]:
+            return reels, cls.PAYOUTS[a]
+        if a == b or b == c:
             # Two of a kind
-            symbol = reels[1]
-            multiplier = cls.PAYOUTS[symbol] // 3
-            result = f"🎰 Two {symbol}! Small win!"
+            return reels, cls.PAYOUTS[b] // 3
+        return reels, 0
+    
+    @classmethod
+    def render(cls, reels: List[int]) -> Tuple[str, str]:
+        """Render a spin. Returns (reel line, result_text)."""
+        symbols = cls.SYMBOLS
+        a, b, c = reels
+        line = f"{symbols[a]} | {symbols[b]} | {symbols[c]}"
+        
+        if a == b == c:
+            result = f"🎰 **JACKPOT!** Three {symbols[a]}!"
+        elif a == b or b == c:
+            result = f"🎰 Two {symbols[b]}! Small win!"
         else:
-            multiplier = 0
             result = "💸 No match. Try again!"
         
-        return reels, multiplier, result
+        return line, result
 
 
 class Casino(commands.Cog):
     """Professional casino with multiple gambling games."""
     
+    # Roulette / slots embed text
+    _ROULETTE_TITLE = "🎡 Roulette"
+    _SLOTS_TITLE = "🎰 Slot Machine"
+    _F_RESULT = "Result"
+    _F_BET = "Your Bet"
+    _F_AMOUNT = "Bet Amount"
+    _F_WIN = "✅ YOU WIN!"
+    _F_LOSE = "❌ YOU LOSE!"
+    _F_SLOTS_WIN = "🎉 WIN!"
+    _F_SLOTS_LOSS = "💸 Loss"
+    _F_NEW_BALANCE = "New Balance"
+    _F_BALANCE = "Balance"
+    _T_ROULETTE_RESULT = "**{}** {}"
+    _T_REELS = "**[ {} ]**"
+    _T_AMOUNT = "💰 {}"
+    _T_PAYOUT = "💰 Payout: {} (+{:,})"
+    _T_SLOTS_PAYOUT = "💰 Payout: {} (+{:,})\n**{}x** multiplier!"
+    _T_ROULETTE_LOST = "💔 Lost: {}"
+    _T_SLOTS_LOST = "Lost: {}"
+    _T_BALANCE = "💵 {}"
+    _T_QUIET = "{} {}: {:+,} coins · Balance: {}"
+    _COLOR_WIN = discord.Color.green().value
+    _COLOR_LOSE = discord.Color.red().value
+    _COLOR_JACKPOT = discord.Color.gold().value
+    
     def __init__(self, bot: Fun2OoshBot, config: Config):
         self.bot = bot
         self.config = config
         self.active_games: Dict[int, BlackjackGame] = {}
     
-    async def check_bet_limits(self, user_id: int, bet: int, session) -> Tuple[bool, Optional[str]]:
-        """Check if bet is within limits."""
+    def check_bet_range(self, bet: int) -> Optional[str]:
+        """Check a bet against the configured min/max. Returns an error message or None."""
         if bet < self.config.min_bet:
-            return False, f"❌ Minimum bet is {self.config.min_bet:,} coins!"
+            return f"❌ Minimum bet is {self.config.min_bet:,} coins!"
         
         if bet > self.config.max_bet:
-            return False, f"❌ Maximum bet is {self.config.max_bet:,} coins!"
+            return f"❌ Maximum bet is {self.config.max_bet:,} coins!"
+        
+        return None
+    
+    async def insufficient_funds_message(self, user_id: int, session) -> str:
+        """Build the not-enough-coins message after a failed debit."""
+        wallet = await EconomyUtils.get_wallet_snapshot(session, user_id)
+        balance = wallet.balance if wallet else 0
+        return f"❌ You don't have enough coins! Balance: {balance:,}"
+    
+    async def check_funds(self, user_id: int, bet: int, session) -> Optional[str]:
+        """Return the not-enough-coins message if the user's balance can't cover the bet.
+        
+        Read-only pre-check so errors can be sent privately before deferring; the
+        debit itself still checks the balance.
+        """
+        wallet = await EconomyUtils.get_wallet_snapshot(session, user_id)
+        balance = wallet.balance if wallet else 0
+        if balance < bet:
+            return f"❌ You don't have enough coins! Balance: {balance:,}"
+        return None
+    
+    async def check_bet_limits(self, user_id: int, bet: int, session) -> Tuple[bool, Optional[str]]:
+        """Check if bet is within limits."""
+        error = self.check_bet_range(bet)
+        if error:
+            return False, error
         
         wallet = await EconomyUtils.get_or_create_wallet(session, user_id)
         if wallet.balance < bet:
@@ -582,80 +665,88 @@ class Casino(commands.Cog):
         """European roulette - Bet on numbers (36x), colors (2x), odd/even (2x), or ranges (2x)."""
         async with self.bot.get_session() as session:
             # Check bet limits
-            valid, error = await self.check_bet_limits(ctx.author.id, amount, session)
-            if not valid:
+            error = self.check_bet_range(amount)
+            if error:
                 await ctx.send(error, ephemeral=True)
                 return
             
             # Validate bet type
             bet_type = bet_type.lower()
-            valid_bets = ['number', 'red', 'black', 'odd', 'even', 'low', 'high']
-            
-            if bet_type not in valid_bets:
-                await ctx.send(
-                    f"❌ Invalid bet type! Choose from: {', '.join(valid_bets)}",
-                    ephemeral=True
-                )
+            if bet_type not in _ROULETTE_BET_SET:
+                await ctx.send(_ROULETTE_INVALID_TYPE, ephemeral=True)
                 return
             
             # Validate number bet
+            number = None
             if bet_type == 'number':
                 if value is None:
                     await ctx.send("❌ You must specify a number (0-36)!", ephemeral=True)
                     return
+                # Parse first so forms int() accepts, like "07" or "+5", still match the table
                 try:
                     number = int(value)
-                    if number < 0 or number > 36:
-                        raise ValueError
-                except:
+                except ValueError:
+                    number = None
+                if number is None or str(number) not in _ROULETTE_NUMBERS:
                     await ctx.send("❌ Invalid number! Must be 0-36.", ephemeral=True)
                     return
             
-            # Deduct bet
-            wallet = await EconomyUtils.get_or_create_wallet(session, ctx.author.id)
-            wallet.balance -= amount
-            await session.commit()
+            # Errors must go out before deferring: the first followup takes the
+            # defer's visibility, so an ephemeral error after a public defer is public
+            error = await self.check_funds(ctx.author.id, amount, session)
+            if error:
+                await ctx.send(error, ephemeral=True)
+                return
             
-            # Spin the wheel
-            result_number = random.randint(0, 36)
+            # Acknowledge slash invocations once the checks pass (no-op for prefix commands)
+            quiet = amount < self.config.embed_threshold
+            await ctx.defer(ephemeral=quiet)
             
-            # Red numbers in roulette
-            red_numbers = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
-            is_red = result_number in red_numbers
-            is_black = result_number != 0 and not is_red
-            is_odd = result_number % 2 == 1 and result_number != 0
-            is_even = result_number % 2 == 0 and result_number != 0
-            is_low = 1 <= result_number <= 18
-            is_high = 19 <= result_number <= 36
+            # Spin the wheel
+            result_number = random.randrange(37)
+            is_red = result_number in _RED_NUMBERS
             
             # Determine win
-            won = False
-            multiplier = 0
+            if number is not None:
+                won = result_number == number
+                multiplier = 36 if won else 0  # 35:1 payout + original bet
+            else:
+                won = _ROULETTE_CHECKS[bet_type](result_number)
+                multiplier = 2 if won else 0
+            payout = amount * multiplier
+            
+            # Take the bet and pay out in one statement (fails if the balance doesn't cover the bet)
+            wallet = await EconomyUtils.try_debit(session, ctx.author.id, amount, payout)
+            if wallet is None:
+                await ctx.send(await self.insufficient_funds_message(ctx.author.id, session), ephemeral=True)
+                return
+            if won:
+                EconomyUtils.record_transaction(
+                    session, ctx.author.id, payout,
+                    'casino', f'Roulette win: {payout} coins'
+                )
             
-            if bet_type == 'number' and value and result_number == int(value):
-                won = True
-                multiplier = 36  # 35:1 payout + original bet
-            elif bet_type == 'red' and is_red:
-                won = True
-                multiplier = 2
-            elif bet_type == 'black' and is_black:
-                won = True
-                multiplier = 2
-            elif bet_type == 'odd' and is_odd:
-                won = True
-                multiplier = 2
-            elif bet_type == 'even' and is_even:
-                won = True
-                multiplier = 2
-            elif bet_type == 'low' and is_low:
-                won = True
-                multiplier = 2
-            elif bet_type == 'high' and is_high:
-                won = True
-                multiplier = 2
+            await session.commit()
             
-            # Create result embed
-            embed = discord.Embed(title="🎡 Roulette", color=discord.Color.red())
+            await self.bot.bet_logger.record(
+                game='roulette',
+                user_id=ctx.author.id,
+                amount=amount,
+                outcome='win' if won else 'lose',
+                payout=payout,
+                bet_type=f"{bet_type}:{number}" if number is not None else bet_type,
+                multiplier=float(multiplier)
+            )
+            
+            fc = format_coins
+            
+            # Small bets get a one-line reply instead of a full embed
+            if quiet:
+                await ctx.send(
+                    self._T_QUIET.format(ctx.author.mention, self._ROULETTE_TITLE, payout - amount, fc(wallet.balance)),
+                    ephemeral=True
+                )
+                return
             
             # Determine color display
             if result_number == 0:
@@ -665,57 +756,22 @@ class Casino(commands.Cog):
             else:
                 color_str = "⚫ Black"
             
-            embed.add_field(
-                name="Result",
-                value=f"**{result_number}** {color_str}",
-                inline=False
-            )
+            fields = [
+                {'name': self._F_RESULT, 'value': self._T_ROULETTE_RESULT.format(result_number, color_str), 'inline': False},
+                {'name': self._F_BET, 'value': bet_type.title() + (" " + value if value else ""), 'inline': True},
+                {'name': self._F_AMOUNT, 'value': self._T_AMOUNT.format(fc(amount)), 'inline': True},
+            ]
             
-            embed.add_field(
-                name="Your Bet",
-                value=f"{bet_type.title()}" + (f" {value}" if value else ""),
-                inline=True
-            )
-            
-            embed.add_field(
-                name="Bet Amount",
-                value=f"💰 {amount:,} coins",
-                inline=True
-            )
-            
-            # Handle payout
             if won:
-                payout = amount * multiplier
-                profit = payout - amount
-                wallet.balance += payout
-                
-                await EconomyUtils.add_money(
-                    session, ctx.author.id, payout,
-                    'casino', f'Roulette win: {payout} coins'
-                )
-                
-                embed.add_field(
-                    name="✅ YOU WIN!",
-                    value=f"💰 Payout: {payout:,} coins (+{profit:,})",
-                    inline=False
-                )
-                embed.color = discord.Color.green()
+                fields.append({'name': self._F_WIN, 'value': self._T_PAYOUT.format(fc(payout), payout - amount), 'inline': False})
+                color = self._COLOR_WIN
             else:
-                embed.add_field(
-                    name="❌ YOU LOSE!",
-                    value=f"💔 Lost: {amount:,} coins",
-                    inline=False
-                )
-                embed.color = discord.Color.red()
+                fields.append({'name': self._F_LOSE, 'value': self._T_ROULETTE_LOST.format(fc(amount)), 'inline': False})
+                color = self._COLOR_LOSE
             
-            await session.commit()
-            
-            embed.add_field(
-                name="New Balance",
-                value=f"💵 {wallet.balance:,} coins",
-                inline=False
-            )
+            fields.append({'name': self._F_NEW_BALANCE, 'value': self._T_BALANCE.format(fc(wallet.balance)), 'inline': False})
             
+            embed = discord.Embed.from_dict({'title': self._ROULETTE_TITLE, 'color': color, 'fields': fields})
             await ctx.send(embed=embed)
     
     @commands.hybrid_command(name="slots", aliases=['s', 'slot'], description="Play the slot machine! Match symbols to win big!")
@@ -724,67 +780,89 @@ class Casino(commands.Cog):
         """Slot machine - Match 3 symbols to win! Payouts from 3x to 50x."""
         async with self.bot.get_session() as session:
             # Check bet limits
-            valid, error = await self.check_bet_limits(ctx.author.id, bet, session)
-            if not valid:
+            error = self.check_bet_range(bet)
+            if error:
                 await ctx.send(error, ephemeral=True)
                 return
             
-            # Deduct bet
-            wallet = await EconomyUtils.get_or_create_wallet(session, ctx.author.id)
-            wallet.balance -= bet
-            await session.commit()
+            # Errors must go out before deferring: the first followup takes the
+            # defer's visibility, so an ephemeral error after a public defer is public
+            error = await self.check_funds(ctx.author.id, bet, session)
+            if error:
+                await ctx.send(error, ephemeral=True)
+                return
+            
+            # Small bets get a one-line reply instead of the animated embed
+            quiet = bet < self.config.embed_threshold
+            
+            # Acknowledge slash invocations once the checks pass (no-op for prefix commands)
+            await ctx.defer(ephemeral=quiet)
             
             # Spin!
-            reels, multiplier, result_text = SlotMachine.spin()
+            reels, multiplier = SlotMachine.spin()
+            payout = bet * multiplier
             
-            # Create animated embed
-            embed = discord.Embed(
-                title="🎰 Slot Machine",
-                description="Spinning...",
-                color=discord.Color.blue()
+            # Take the bet and pay out in one statement (fails if the balance doesn't cover the bet)
+            wallet = await EconomyUtils.try_debit(session, ctx.author.id, bet, payout)
+            if wallet is None:
+                await ctx.send(await self.insufficient_funds_message(ctx.author.id, session), ephemeral=True)
+                return
+            if multiplier > 0:
+                EconomyUtils.record_transaction(
+                    session, ctx.author.id, payout,
+                    'casino', f'Slots win: {payout} coins'
+                )
+            
+            await session.commit()
+            
+            if not quiet:
+                embed = discord.Embed(
+                    title=self._SLOTS_TITLE,
+                    description="Spinning...",
+                    color=discord.Color.blue()
+                )
+                message = await ctx.send(embed=embed)
+            
+            await self.bot.bet_logger.record(
+                game='slots',
+                user_id=ctx.author.id,
+                amount=bet,
+                outcome='win' if multiplier > 0 else 'lose',
+                payout=payout,
+                multiplier=float(multiplier)
             )
-            message = await ctx.send(embed=embed)
+            
+            fc = format_coins
+            
+            if quiet:
+                await ctx.send(
+                    self._T_QUIET.format(ctx.author.mention, self._SLOTS_TITLE, payout - bet, fc(wallet.balance)),
+                    ephemeral=True
+                )
+                return
             
             # Animation
             await asyncio.sleep(1)
             
             # Show result
-            embed.description = f"**[ {' | '.join(reels)} ]**"
-            embed.add_field(name="Result", value=result_text, inline=False)
+            reel_line, result_text = SlotMachine.render(reels)
+            fields = [{'name': self._F_RESULT, 'value': result_text, 'inline': False}]
             
-            # Calculate payout
             if multiplier > 0:
-                payout = bet * multiplier
-                profit = payout - bet
-                wallet.balance += payout
-                
-                await EconomyUtils.add_money(
-                    session, ctx.author.id, payout,
-                    'casino', f'Slots win: {payout} coins'
-                )
-                
-                embed.add_field(
-                    name="🎉 WIN!",
-                    value=f"💰 Payout: {payout:,} coins (+{profit:,})\n**{multiplier}x** multiplier!",
-                    inline=False
-                )
-                embed.color = discord.Color.gold()
+                fields.append({'name': self._F_SLOTS_WIN, 'value': self._T_SLOTS_PAYOUT.format(fc(payout), payout - bet, multiplier), 'inline': False})
+                color = self._COLOR_JACKPOT
             else:
-                embed.add_field(
-                    name="💸 Loss",
-                    value=f"Lost: {bet:,} coins",
-                    inline=False
-                )
-                embed.color = discord.Color.red()
+                fields.append({'name': self._F_SLOTS_LOSS, 'value': self._T_SLOTS_LOST.format(fc(bet)), 'inline': False})
+                color = self._COLOR_LOSE
             
-            await session.commit()
-            
-            embed.add_field(
-                name="Balance",
-                value=f"💵 {wallet.balance:,} coins",
-                inline=False
-            )
+            fields.append({'name': self._F_BALANCE, 'value': self._T_BALANCE.format(fc(wallet.balance)), 'inline': False})
             
+            embed = discord.Embed.from_dict({
+                'title': self._SLOTS_TITLE,
+                'description': self._T_REELS.format(reel_line),
+                'color': color,
+                'fields': fields,
+            })
             await message.edit(embed=embed)
     
     @commands.hybrid_command(name="coinflip", aliases=['cf'], description="Flip a coin! Heads or tails?")
@@ -2,22 +2,33 @@
 Economy cog for wallet management and basic income commands.
 """
 
+import asyncio
 import time
 from typing import List, Optional, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
-from sqlalchemy import desc, func, select
+from sqlalchemy import bindparam, case, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import Bet, Transaction, Wallet
 from utils.anti_fraud import anti_fraud
 from utils.cooldowns import check_cooldown, cooldown_manager
 from utils.config import Config
-from utils.economy_utils import EconomyUtils
+from utils.economy_utils import EconomyUtils, ProfileSnapshot
 from bot import Fun2OoshBot
-from utils.helpers import EmbedBuilder, format_coins, responsible_gaming_notice
+from utils.helpers import EmbedBuilder, format_coins
+
+# Wallet, transaction count and total earned in one round-trip; built once so the
+# compiled form is reused across profile views
+PROFILE_STMT = select(
+    Wallet,
+    func.count(Transaction.id),
+    func.sum(case((Transaction.amount > 0, Transaction.amount)))
+).outerjoin(
+    Transaction, Transaction.user_id == Wallet.user_id
+).where(Wallet.user_id == bindparam('u')).group_by(Wallet.user_id)
 
 
 class Economy(commands.Cog):
@@ -31,27 +42,29 @@ class Economy(commands.Cog):
         """Called when the cog is loaded."""
         pass
 
+    async def _build_balance_embed(self, user: discord.abc.User) -> discord.Embed:
+        """Fetch (or create) a user's wallet and build their balance embed."""
+        async with self.bot.get_session() as session:
+            wallet = await EconomyUtils.get_wallet_snapshot(session, user.id)
+            if wallet is None:
+                wallet = await EconomyUtils.get_or_create_wallet(session, user.id)
+                await session.commit()  # Only a new wallet needs saving
+
+        return EmbedBuilder.wallet_embed(user, wallet.balance, wallet.bank)
+
     @commands.command(name='balance', aliases=['bal', 'wallet'])
     async def balance(self, ctx: commands.Context, user: Optional[discord.User] = None):
         """Check your or another user's balance."""
-        target_user = user or ctx.author
-
-        async with self.bot.get_session() as session:
-            wallet = await EconomyUtils.get_or_create_wallet(session, target_user.id)
-            await session.commit()  # Ensure wallet is saved
-
-        embed = EmbedBuilder.wallet_embed(target_user, wallet.balance, wallet.bank)
+        embed = await self._build_balance_embed(user or ctx.author)
         await ctx.send(embed=embed)
 
     @app_commands.command(name='balance', description='Check your balance')
     async def balance_slash(self, interaction: discord.Interaction):
         """Slash command for balance."""
-        async with self.bot.get_session() as session:
-            wallet = await EconomyUtils.get_or_create_wallet(session, interaction.user.id)
-            await session.commit()  # Ensure wallet is saved
-
-        embed = EmbedBuilder.wallet_embed(interaction.user, wallet.balance, wallet.bank)
-        await interaction.response.send_message(embed=embed)
+        # Acknowledge first so a slow DB doesn't miss Discord's 3s deadline
+        await interaction.response.defer(thinking=True)
+        embed = await self._build_balance_embed(interaction.user)
+        await interaction.followup.send(embed=embed)
 
     @commands.command(name='work')
     @check_cooldown('work', 1800)  # 30 minutes
@@ -425,6 +438,8 @@ class Economy(commands.Cog):
                 session, ctx.author.id, user.id, amount,
                 f'Transfer from {ctx.author.display_name}'
             )
+            if success:
+                await session.commit()
 
         if success:
             embed = EmbedBuilder.success_embed(
@@ -437,16 +452,13 @@ class Economy(commands.Cog):
 
     @app_commands.command(name='transfer', description='Transfer coins to another user')
     @app_commands.describe(user='User to transfer to', amount='Amount to transfer')
-    async def transfer_slash(self, interaction: discord.Interaction, user: discord.User, amount: int):
+    async def transfer_slash(self, interaction: discord.Interaction, user: discord.User, amount: app_commands.Range[int, 1]):
         """Slash command for transfer."""
+        # Discord enforces the amount's minimum before the command runs
         if user == interaction.user:
             await interaction.response.send_message("You can't transfer coins to yourself.")
             return
 
-        if amount <= 0:
-            await interaction.response.send_message("Transfer amount must be positive.")
-            return
-
         # Check for fraud
         suspicious, reason = anti_fraud.is_suspicious(interaction.user.id, amount, 'transfer')
         if suspicious:
@@ -458,6 +470,8 @@ class Economy(commands.Cog):
                 session, interaction.user.id, user.id, amount,
                 f'Transfer from {interaction.user.display_name}'
             )
+            if success:
+                await session.commit()
 
         if success:
             embed = EmbedBuilder.success_embed(
@@ -485,6 +499,7 @@ class Economy(commands.Cog):
     @app_commands.command(name='leaderboard', description='Show the leaderboard')
     async def leaderboard_slash(self, interaction: discord.Interaction):
         """Slash command for leaderboard."""
+        await interaction.response.defer(thinking=True)
         async with self.bot.get_session() as session:
             stmt = select(
                 Wallet.user_id,
@@ -494,7 +509,7 @@ class Economy(commands.Cog):
             leaderboard = [(row.user_id, row.total) for row in result.all()]
 
         embed = EmbedBuilder.leaderboard_embed(leaderboard, "🏆 Richest Players")
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @commands.command(name='beg', aliases=['b'])
     @check_cooldown('beg', 60)  # 1 minute
@@ -713,6 +728,16 @@ class Economy(commands.Cog):
             embed.set_footer(text="Economy • Quick Gamble")
             await ctx.send(embed=embed)
 
+    async def _display_name(self, user_id: int) -> str:
+        """A user's display name from the client cache, falling back to fetching them."""
+        user = self.bot.get_user(user_id)
+        if user is None:
+            try:
+                user = await self.bot.fetch_user(user_id)
+            except Exception:
+                return f"User {user_id}"
+        return user.display_name
+
     @commands.command(name='richest', aliases=['top10', 'baltop'])
     async def richest(self, ctx: commands.Context):
         """Show the top 15 richest users with detailed stats."""
@@ -736,14 +761,10 @@ class Economy(commands.Cog):
         )
         
         medals = ["🥇", "🥈", "🥉"]
+        # Resolve every name at once; only users missing from the client cache cost an API call
+        names = await asyncio.gather(*(self._display_name(user_data.user_id) for user_data in users))
         
-        for idx, user_data in enumerate(users, 1):
-            try:
-                user = await self.bot.fetch_user(user_data.user_id)
-                name = user.display_name
-            except:
-                name = f"User {user_data.user_id}"
-            
+        for idx, (user_data, name) in enumerate(zip(users, names), 1):
             medal = medals[idx - 1] if idx <= 3 else f"#{idx}"
             
             embed.add_field(
@@ -831,28 +852,33 @@ class Economy(commands.Cog):
         
         await ctx.send(embed=embed)
 
+    async def _load_profile(self, user_id: int) -> ProfileSnapshot:
+        """Fetch a user's profile numbers, from the short-lived cache when possible."""
+        profile = EconomyUtils.get_cached_profile(user_id)
+        if profile is not None:
+            return profile
+        
+        async with self.bot.get_session() as session:
+            row = (await session.execute(PROFILE_STMT, {'u': user_id})).first()
+        
+        if row is None:
+            # No wallet yet: show a fresh wallet's numbers. Creating one here would be
+            # rolled back anyway, since profile never commits.
+            profile = ProfileSnapshot(0, 0, 0, 0)
+        else:
+            wallet, tx_count, total_earned = row
+            profile = ProfileSnapshot(wallet.balance, wallet.bank, tx_count, total_earned or 0)
+        
+        EconomyUtils.cache_profile(user_id, profile)
+        return profile
+
     @commands.command(name='profile', aliases=['prof', 'stats'])
     async def profile(self, ctx: commands.Context, user: Optional[discord.User] = None):
         """View detailed profile and economy stats."""
         target = user or ctx.author
         
-        async with self.bot.get_session() as session:
-            wallet = await EconomyUtils.get_or_create_wallet(session, target.id)
-            
-            # Get transaction count
-            tx_stmt = select(func.count(Transaction.id)).where(Transaction.user_id == target.id)
-            tx_result = await session.execute(tx_stmt)
-            tx_count = tx_result.scalar() or 0
-            
-            # Get total earned
-            earn_stmt = select(func.sum(Transaction.amount)).where(
-                Transaction.user_id == target.id,
-                Transaction.amount > 0
-            )
-            earn_result = await session.execute(earn_stmt)
-            total_earned = earn_result.scalar() or 0
-        
-        total_wealth = wallet.balance + wallet.bank
+        profile = await self._load_profile(target.id)
+        total_wealth = profile.balance + profile.bank
         
         embed = discord.Embed(
             title=f"📊 {target.display_name}'s Profile",
@@ -864,13 +890,13 @@ class Economy(commands.Cog):
         
         embed.add_field(
             name="💰 WEALTH",
-            value=f"```\nTotal: {total_wealth:,}\nWallet: {wallet.balance:,}\nBank: {wallet.bank:,}\n```",
+            value=f"```\nTotal: {total_wealth:,}\nWallet: {profile.balance:,}\nBank: {profile.bank:,}\n```",
             inline=False
         )
         
         embed.add_field(
             name="📈 STATISTICS",
-            value=f"```\nTransactions: {tx_count}\nTotal Earned: {total_earned:,}\n```",
+            value=f"```\nTransactions: {profile.tx_count}\nTotal Earned: {profile.total_earned:,}\n```",
             inline=False
         )
         
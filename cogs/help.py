@@ -1,7 +1,9 @@
+import weakref
+
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Optional
+from typing import Dict, Optional
 
 
 # Emoji mapping for each cog category
@@ -38,12 +40,112 @@ COG_DESCRIPTIONS = {
     "afksystem": "💤 Away From Keyboard system - Set AFK status with custom reasons, auto-respond to mentions, and track time away",
 }
 
+# Text of the main help page
+HOME_DESCRIPTION = (
+    "Welcome to Eigen Bot! A feature-rich Discord bot with economy, games, and community features.\n\n"
+    "**How to use commands:**\n"
+    "• Prefix: `?command` (e.g., `?balance`)\n"
+    "• Slash: `/command` (e.g., `/balance`)\n\n"
+    "**Select a category below to view commands!**"
+)
+HOME_FOOTER = "Use ?helpmenu <command> for detailed command help • Tip: Try the dropdown menu!"
+
+# Dropdown option descriptions, cut to fit once at import
+COG_DESCRIPTIONS_SHORT = {name: description[:50] for name, description in COG_DESCRIPTIONS.items()}
+DEFAULT_SHORT_DESCRIPTION = "View commands in this category"
+
+# Reply for ?helpmenu <query> when nothing matches; the description is filled in per query
+_NOT_FOUND_TEMPLATE = {'title': "❌ Not Found", 'color': 0xe74c3c, 'type': 'rich'}
+
+# Discord embed limits (description, fields per embed, characters across the whole embed)
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_FIELD_COUNT_LIMIT = 25
+EMBED_TOTAL_LIMIT = 6000
+
+# Lowercase cog names left out of the category listings
+_SKIP_COGS = frozenset({'helpcog'})
+
+# Visible commands per loaded cog; entries go away with the cog object
+_VISIBLE_COMMANDS: "weakref.WeakKeyDictionary[commands.Cog, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _help_line(cmd: commands.Command) -> tuple:
+    """Return a command's (signature, short doc), formatted once per command object."""
+    # cmd.signature re-walks the parameters on every access, so keep the result on the command
+    line = cmd.__dict__.get('_help_line')
+    if line is None:
+        line = cmd.__dict__['_help_line'] = (
+            f"{cmd.name} {cmd.signature}".strip(),
+            cmd.short_doc or "No description",
+        )
+    return line
+
+
+def _trim(text: str, limit: int) -> str:
+    """Cut text to at most `limit` characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def _add_command_list(embed: discord.Embed, commands_list: list):
+    """Append command lines to the embed description, or to fields if they won't fit.
+
+    Stays inside Discord's embed limits so an oversized cog can't make the send fail;
+    commands that don't fit are summarised in a final "+N more" field.
+    """
+    # A single description is one string in the payload instead of one dict per field
+    description = f"{embed.description}\n\n**Commands**\n" + "\n\n".join(commands_list)
+    if len(description) <= EMBED_DESCRIPTION_LIMIT:
+        embed.description = description
+        return
+
+    # Split into chunks by character count (max 1000 to be safe)
+    chunks = []
+    current_chunk = []
+    current_length = 0
+    
+    for cmd_text in commands_list:
+        cmd_text = _trim(cmd_text, 1000)
+        cmd_length = len(cmd_text) + 2  # +2 for "\n\n" separator
+        
+        # If adding this command would exceed limit, start new field
+        if current_length + cmd_length > 1000 and current_chunk:
+            chunks.append(current_chunk)
+            current_chunk = []
+            current_length = 0
+        
+        current_chunk.append(cmd_text)
+        current_length += cmd_length
+    
+    if current_chunk:
+        chunks.append(current_chunk)
+    
+    # Leave room for the footer (set by the caller) and the "+N more" field
+    budget = EMBED_TOTAL_LIMIT - len(embed) - 200
+    shown = 0
+    for field_number, chunk in enumerate(chunks):
+        field_name = "Commands" if field_number == 0 else f"Commands (continued {field_number})"
+        value = "\n\n".join(chunk)
+        if field_number >= EMBED_FIELD_COUNT_LIMIT - 1 or len(field_name) + len(value) > budget:
+            break
+        embed.add_field(name=field_name, value=value, inline=False)
+        budget -= len(field_name) + len(value)
+        shown += len(chunk)
+    
+    remaining = len(commands_list) - shown
+    if remaining:
+        embed.add_field(
+            name="More commands",
+            value=f"+{remaining} more — use ?helpmenu <command> for details",
+            inline=False
+        )
+
 
 class HelpSelect(discord.ui.Select):
     """Dropdown menu for selecting help categories."""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.help_cog = bot.get_cog('HelpCog')
         
         # Build options from loaded cogs
         options = [
@@ -56,29 +158,19 @@ class HelpSelect(discord.ui.Select):
         ]
         
         # Add options for each loaded cog (use actual cog names from bot.cogs)
-        for cog_name, cog in sorted(bot.cogs.items()):
-            # Skip help cog itself
-            if cog_name.lower() == 'helpcog':
-                continue
-            
-            # Get visible commands count
-            visible_count = sum(1 for cmd in cog.get_commands() 
-                              if not getattr(cmd, 'hidden', False) and cmd.enabled)
-            
-            if visible_count == 0:
-                continue
-                
-            emoji = COG_EMOJIS.get(cog_name.lower(), "📁")
-            description = COG_DESCRIPTIONS.get(cog_name.lower(), "View commands in this category")
-            
-            options.append(
-                discord.SelectOption(
-                    label=f"{cog_name}",
-                    value=cog_name.lower(),
-                    description=f"{description[:50]}",
-                    emoji=emoji
-                )
+        get_emoji = COG_EMOJIS.get
+        get_description = COG_DESCRIPTIONS_SHORT.get
+        options.extend(
+            discord.SelectOption(
+                label=entry['name'],
+                value=lname,
+                description=get_description(lname, DEFAULT_SHORT_DESCRIPTION),
+                emoji=get_emoji(lname, "📁")
             )
+            for lname, entry in self.help_cog.cog_index().items()
+            # Skip help cog itself and cogs with nothing to show
+            if lname not in _SKIP_COGS and entry['count']
+        )
         
         super().__init__(
             placeholder="Select a category to view commands...",
@@ -95,123 +187,28 @@ class HelpSelect(discord.ui.Select):
             embed = self._create_home_embed()
         else:
             embed = self._create_category_embed(selected)
+            if embed is None:
+                # The cog was unloaded after this menu was built; keep the current page
+                await interaction.response.send_message(
+                    embed=discord.Embed(
+                        title="❌ Category Not Found",
+                        description=f"The category `{selected}` could not be found.",
+                        color=discord.Color.red()
+                    ),
+                    ephemeral=True
+                )
+                return
         
-        await interaction.response.edit_message(embed=embed, view=self.view)
+        # The menu itself doesn't change, so leave the components out of the edit
+        await interaction.response.edit_message(embed=embed)
     
     def _create_home_embed(self) -> discord.Embed:
         """Create the main help embed."""
-        embed = discord.Embed(
-            title="📚 Eigen Bot - Help Menu",
-            description=(
-                "Welcome to Eigen Bot! A feature-rich Discord bot with economy, games, and community features.\n\n"
-                "**How to use commands:**\n"
-                "• Prefix: `?command` (e.g., `?balance`)\n"
-                "• Slash: `/command` (e.g., `/balance`)\n\n"
-                "**Select a category below to view commands!**"
-            ),
-            color=discord.Color.blue()
-        )
-        
-        # Add category overview (use actual loaded cogs)
-        categories = []
-        for cog_name, cog in sorted(self.bot.cogs.items()):
-            # Skip help cog
-            if cog_name.lower() == 'helpcog':
-                continue
-            
-            visible_count = sum(1 for cmd in cog.get_commands() 
-                              if not getattr(cmd, 'hidden', False) and cmd.enabled)
-            
-            if visible_count > 0:
-                emoji = COG_EMOJIS.get(cog_name.lower(), "📁")
-                categories.append(f"{emoji} **{cog_name}** - {visible_count} commands")
-        
-        if categories:
-            embed.add_field(
-                name="📂 Available Categories",
-                value="\n".join(categories),
-                inline=False
-            )
-        
-        embed.set_footer(text="Use ?helpmenu <command> for detailed command help • Tip: Try the dropdown menu!")
-        return embed
+        return self.help_cog.home_embed()
     
-    def _create_category_embed(self, cog_name: str) -> discord.Embed:
-        """Create embed for a specific category."""
-        # Find the cog (case-insensitive)
-        cog = None
-        actual_cog_name = None
-        for name, c in self.bot.cogs.items():
-            if name.lower() == cog_name.lower():
-                cog = c
-                actual_cog_name = name
-                break
-        
-        if cog is None:
-            return discord.Embed(
-                title="❌ Category Not Found",
-                description=f"The category `{cog_name}` could not be found.",
-                color=discord.Color.red()
-            )
-        
-        emoji = COG_EMOJIS.get(cog_name.lower(), "📁")
-        description = COG_DESCRIPTIONS.get(cog_name.lower(), "Commands in this category")
-        
-        embed = discord.Embed(
-            title=f"{emoji} {actual_cog_name} Commands",
-            description=description,
-            color=discord.Color.green()
-        )
-        
-        # Group commands by type or just list them
-        commands_list = []
-        for cmd in cog.get_commands():
-            if not getattr(cmd, 'hidden', False) and cmd.enabled:
-                # Format: command name + signature + description
-                signature = f"{cmd.name} {cmd.signature}".strip()
-                desc = cmd.short_doc or "No description"
-                # Limit description length to prevent overflow
-                if len(desc) > 80:
-                    desc = desc[:77] + "..."
-                commands_list.append(f"`{signature}`\n└─ {desc}")
-        
-        if commands_list:
-            # Split into chunks by character count (max 1000 to be safe)
-            current_chunk = []
-            current_length = 0
-            field_number = 0
-            
-            for cmd_text in commands_list:
-                cmd_length = len(cmd_text) + 2  # +2 for "\n\n" separator
-                
-                # If adding this command would exceed limit, start new field
-                if current_length + cmd_length > 1000 and current_chunk:
-                    field_name = "Commands" if field_number == 0 else f"Commands (continued {field_number})"
-                    embed.add_field(
-                        name=field_name,
-                        value="\n\n".join(current_chunk),
-                        inline=False
-                    )
-                    current_chunk = []
-                    current_length = 0
-                    field_number += 1
-                
-                current_chunk.append(cmd_text)
-                current_length += cmd_length
-            
-            # Add remaining commands
-            if current_chunk:
-                field_name = "Commands" if field_number == 0 else f"Commands (continued {field_number})"
-                embed.add_field(
-                    name=field_name,
-                    value="\n\n".join(current_chunk),
-                    inline=False
-                )
-        else:
-            embed.description = "No commands available in this category."
-        
-        embed.set_footer(text=f"Use ?helpmenu <command> for detailed help • Select another category from the menu")
-        return embed
+    def _create_category_embed(self, cog_name: str) -> Optional[discord.Embed]:
+        """Create embed for a specific category, or None if it isn't loaded."""
+        return self.help_cog.category_embed(cog_name)
 
 
 class HelpView(discord.ui.View):
@@ -221,7 +218,9 @@ class HelpView(discord.ui.View):
         super().__init__(timeout=180)  # 3 minute timeout
         self.bot = bot
         self.author_id = author_id
-        self.add_item(HelpSelect(bot))
+        self.message: Optional[discord.Message] = None
+        self._select = HelpSelect(bot)
+        self.add_item(self._select)
     
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Only allow the command author to use the dropdown."""
@@ -235,10 +234,13 @@ class HelpView(discord.ui.View):
     
     async def on_timeout(self):
         """Disable the dropdown after timeout."""
-        # Disable all items in the view
-        for item in self.children:
-            if isinstance(item, discord.ui.Select):
-                item.disabled = True
+        self._select.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                # Message was deleted or is no longer editable
+                pass
 
 
 class HelpCog(commands.Cog):
@@ -250,42 +252,129 @@ class HelpCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Visible command metadata per cog, keyed by lowercase cog name, and the
+        # home embed built from it; both are rebuilt only when the loaded cogs change
+        self._index: Dict[str, dict] = {}
+        self._index_key: tuple = ()
+        self._home_dict: Optional[dict] = None
+        # Category pages are only rendered once someone opens them; pages are kept
+        # serialized and each send gets its own Embed built from the cached dict
+        self._detail_cache: Dict[str, dict] = {}
 
-    @commands.hybrid_command(name="helpmenu", description="Show help for commands or a specific command/cog")
-    @app_commands.describe(query="Optional command or cog name to show detailed help for")
-    async def helpmenu(self, ctx: commands.Context, *, query: Optional[str] = None):
-        """Show interactive help menu or detailed help for a specific command/category."""
+    def cog_index(self) -> Dict[str, dict]:
+        """Return the per-cog command index, rebuilding it if cogs were added, removed or reloaded."""
+        # Keyed on the cog instances, not their names: a reloaded cog keeps its name
+        # but is a new object with possibly different commands
+        key = tuple(self.bot.cogs.values())
+        if key != self._index_key:
+            self._rebuild_index()
+            self._index_key = key
+        return self._index
+
+    @staticmethod
+    def _visible(cog: commands.Cog) -> tuple:
+        """Return the cog's commands that are neither hidden nor disabled."""
+        visible = _VISIBLE_COMMANDS.get(cog)
+        if visible is None:
+            visible = _VISIBLE_COMMANDS[cog] = tuple(
+                cmd for cmd in cog.get_commands() if not cmd.hidden and cmd.enabled
+            )
+        return visible
+
+    def _rebuild_index(self):
+        """Record each cog's visible command count; signatures are filled in on first view."""
+        _VISIBLE_COMMANDS.clear()
+        index = {}
+        for cog_name, cog in sorted(self.bot.cogs.items()):
+            index[cog_name.lower()] = {
+                'name': cog_name,
+                'count': len(self._visible(cog)),
+            }
+        self._index = index
+        self._home_dict = None
+        self._detail_cache.clear()
+
+    def _command_lines(self, entry: dict) -> tuple:
+        """Return the (signatures, docs) lists for an index entry, formatting them once."""
+        if 'signatures' not in entry:
+            signatures = []
+            docs = []
+            for cmd in self._visible(self.bot.get_cog(entry['name'])):
+                signature, doc = _help_line(cmd)
+                signatures.append(signature)
+                docs.append(doc)
+            entry['signatures'] = signatures
+            entry['docs'] = docs
+        return entry['signatures'], entry['docs']
+
+    def category_embed(self, cog_name: str) -> Optional[discord.Embed]:
+        """Return the dropdown embed for a category, building it the first time it is opened.
+
+        Returns None if no loaded cog has that name.
+        """
+        lname = cog_name.lower()
+        entry = self.cog_index().get(lname)
+        if entry is None:
+            return None
         
-        # If a specific command or cog name was provided, show detailed help
-        if query:
-            await self._detailed_help(ctx, query)
-            return
+        data = self._detail_cache.get(lname)
+        if data is None:
+            data = self._detail_cache[lname] = self._build_category_embed(cog_name, entry).to_dict()
+        return discord.Embed.from_dict(dict(data))
 
-        # Create main help embed with dropdown menu
+    def _build_category_embed(self, cog_name: str, entry: dict) -> discord.Embed:
+        """Create embed for a specific category."""
+        # Group commands by type or just list them
+        commands_list = []
+        for signature, desc in zip(*self._command_lines(entry)):
+            # Limit description length to prevent overflow
+            if len(desc) > 80:
+                desc = desc[:77] + "..."
+            commands_list.append(f"`{signature}`\n└─ {desc}")
+        
+        emoji = COG_EMOJIS.get(cog_name.lower(), "📁")
+        if commands_list:
+            description = COG_DESCRIPTIONS.get(cog_name.lower(), "Commands in this category")
+        else:
+            description = "No commands available in this category."
+        
+        embed = discord.Embed(
+            title=f"{emoji} {entry['name']} Commands",
+            description=description,
+            color=discord.Color.green()
+        )
+        if commands_list:
+            _add_command_list(embed, commands_list)
+        
+        embed.set_footer(text=f"Use ?helpmenu <command> for detailed help • Select another category from the menu")
+        return embed
+
+    def home_embed(self) -> discord.Embed:
+        """Return the main help embed, rebuilding it if cogs were added or removed."""
+        index = self.cog_index()
+        if self._home_dict is None:
+            self._home_dict = self._build_home_embed(index).to_dict()
+        return discord.Embed.from_dict(dict(self._home_dict))
+
+    def _build_home_embed(self, index: Dict[str, dict]) -> discord.Embed:
+        """Create the main help embed."""
         embed = discord.Embed(
             title="📚 Eigen Bot - Help Menu",
-            description=(
-                "Welcome to Eigen Bot! A feature-rich Discord bot with economy, games, and community features.\n\n"
-                "**How to use commands:**\n"
-                "• Prefix: `?command` (e.g., `?balance`)\n"
-                "• Slash: `/command` (e.g., `/balance`)\n\n"
-                "**Select a category below to view commands!**"
-            ),
+            description=HOME_DESCRIPTION,
             color=discord.Color.blue()
         )
         
-        # Add category overview
+        # Add category overview (use actual loaded cogs)
         categories = []
-        for cog_name, cog in sorted(self.bot.cogs.items()):
+        for lname, entry in index.items():
             # Skip help cog
-            if cog_name.lower() == 'helpcog':
+            if lname in _SKIP_COGS:
                 continue
             
-            visible_count = sum(1 for cmd in cog.get_commands() 
-                              if not getattr(cmd, 'hidden', False) and cmd.enabled)
-            
+            cog_name = entry['name']
+            visible_count = entry['count']
             if visible_count > 0:
-                emoji = COG_EMOJIS.get(cog_name.lower(), "📁")
+                emoji = COG_EMOJIS.get(lname, "📁")
                 categories.append(f"{emoji} **{cog_name}** - {visible_count} commands")
         
         if categories:
@@ -295,11 +384,24 @@ class HelpCog(commands.Cog):
                 inline=False
             )
         
-        embed.set_footer(text="Use ?helpmenu <command> for detailed command help • Tip: Try the dropdown menu!")
+        embed.set_footer(text=HOME_FOOTER)
+        return embed
+
+    @commands.hybrid_command(name="helpmenu", description="Show help for commands or a specific command/cog")
+    @app_commands.describe(query="Optional command or cog name to show detailed help for")
+    async def helpmenu(self, ctx: commands.Context, *, query: Optional[str] = None):
+        """Show interactive help menu or detailed help for a specific command/category."""
         
+        # If a specific command or cog name was provided, show detailed help
+        if query:
+            await self._detailed_help(ctx, query)
+            return
+
+        embed = self.home_embed()
+
         # Create view with dropdown
         view = HelpView(self.bot, ctx.author.id)
-        await ctx.send(embed=embed, view=view)
+        view.message = await ctx.send(embed=embed, view=view)
 
     async def _detailed_help(self, ctx: commands.Context, query: str):
         """Show detailed help for a specific command or category."""
@@ -348,58 +450,38 @@ class HelpCog(commands.Cog):
             await ctx.send(embed=embed)
             return
 
-        # Try to find a cog (case-insensitive)
-        cog = None
-        actual_cog_name = None
-        for name, c in self.bot.cogs.items():
-            if name.lower() == query.lower():
-                cog = c
-                actual_cog_name = name
-                break
+        # Try to find a cog (case-insensitive); the index is keyed by lowercase cog name
+        entry = self.cog_index().get(query.lower())
         
-        if cog and actual_cog_name:
+        if entry is not None:
+            actual_cog_name = entry['name']
+            commands_list = [
+                f"`{signature}`\n└─ {desc}"
+                for signature, desc in zip(*self._command_lines(entry))
+            ]
+
             emoji = COG_EMOJIS.get(actual_cog_name.lower(), "📁")
-            description = COG_DESCRIPTIONS.get(actual_cog_name.lower(), "Commands in this category")
+            if commands_list:
+                description = COG_DESCRIPTIONS.get(actual_cog_name.lower(), "Commands in this category")
+            else:
+                description = "No visible commands in this category."
             
             embed = discord.Embed(
                 title=f"{emoji} {actual_cog_name} Commands",
                 description=description,
                 color=discord.Color.green()
             )
-            
-            commands_list = []
-            for c in cog.get_commands():
-                if not getattr(c, 'hidden', False) and c.enabled:
-                    signature = f"{c.name} {c.signature}".strip()
-                    desc = c.short_doc or "No description"
-                    commands_list.append(f"`{signature}`\n└─ {desc}")
-
             if commands_list:
-                # Split into chunks if too long
-                chunk_size = 10
-                for i in range(0, len(commands_list), chunk_size):
-                    chunk = commands_list[i:i+chunk_size]
-                    field_name = "Commands" if i == 0 else "Commands (continued)"
-                    embed.add_field(
-                        name=field_name,
-                        value="\n\n".join(chunk),
-                        inline=False
-                    )
-            else:
-                embed.description = "No visible commands in this category."
+                _add_command_list(embed, commands_list)
 
             embed.set_footer(text="Use ?helpmenu <command> for detailed command help")
             await ctx.send(embed=embed)
             return
 
         # If nothing found
-        await ctx.send(
-            embed=discord.Embed(
-                title="❌ Not Found",
-                description=f"No command or category named `{query}` was found.\n\nUse `?helpmenu` to see all available commands.",
-                color=discord.Color.red()
-            )
-        )
+        data = dict(_NOT_FOUND_TEMPLATE)
+        data['description'] = f"No command or category named `{query}` was found.\n\nUse `?helpmenu` to see all available commands."
+        await ctx.send(embed=discord.Embed.from_dict(data))
 
 
 async def setup(bot: commands.Bot):
@@ -413,16 +495,9 @@ async def setup(bot: commands.Bot):
                 # Best-effort removal
                 pass
 
-        # Remove any app command named 'help' from the command tree (guild/global)
+        # Remove any global app command named 'help' from the command tree
         try:
-            # Clear commands with the name 'help' on the tree (best-effort)
-            for cmd in list(bot.tree.get_commands()):
-                if getattr(cmd, 'name', '') == 'help':
-                    try:
-                        bot.tree.remove_command(cmd.name, guild=None)
-                    except Exception:
-                        # ignore failures removing individual commands
-                        pass
+            bot.tree.remove_command('help', guild=None)
         except Exception:
             pass
     except Exception:
@@ -4,100 +4,258 @@ Invite Tracker Cog - Professional invite tracking system for Discord servers.
 Tracks member invites, maintains leaderboards, and provides detailed analytics.
 """
 
+import asyncio
+import time
+
 import discord
 from discord import app_commands
 from discord.ext import commands
-from typing import Optional, Dict, List
-from datetime import datetime
+from typing import Optional, Dict, List, Tuple
 import aiosqlite
 from pathlib import Path
 
+# Applied once to the cog's shared connection; WAL lets the read commands run
+# alongside join/leave writes and NORMAL sync skips an fsync on every commit
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+    # Fold the WAL back into the database every 1000 pages so it stays small
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Guild invite lists fetched in parallel while warming the cache on load
+INVITE_FETCH_CONCURRENCY = 20
+
+# Seconds a cached stats row or leaderboard is served before re-reading the database
+STATS_CACHE_TTL = 30
+
 
 class InviteTracker(commands.Cog):
     """Professional invite tracking system with analytics and leaderboards."""
+    
+    _MEDALS = ("🥇", "🥈", "🥉")
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.db_path = Path("data/invites.db")
         self.db_path.parent.mkdir(exist_ok=True)
-        self.invite_cache: Dict[int, Dict[str, discord.Invite]] = {}
+        # guild_id -> {invite code: uses}; the use count is all the join diff needs
+        self.invite_cache: Dict[int, Dict[str, int]] = {}
+        self.db: Optional[aiosqlite.Connection] = None
+        # Writes share one connection, so each write + commit runs alone. Reads skip
+        # the lock but still run in order on that connection's single worker thread,
+        # and a read between a locked write and its commit sees the uncommitted rows
+        self.write_lock = asyncio.Lock()
+        # Read caches, dropped by update_invite_stats whenever the underlying rows change
+        self._stats_cache: Dict[Tuple[int, int], Tuple[float, Dict[str, int]]] = {}
+        self._lb_cache: Dict[int, Tuple[float, List[tuple]]] = {}
+        # invitedocs never changes, so build its embed once
+        self._docs_embed = self._build_docs_embed()
         
     async def cog_load(self):
         """Initialize database on cog load."""
+        # One connection for the cog's lifetime instead of a new thread + file open per query
+        self.db = await aiosqlite.connect(self.db_path)
+        for pragma in SQLITE_PRAGMAS:
+            await self.db.execute(pragma)
         await self.setup_database()
-        # Cache invites for all guilds
-        for guild in self.bot.guilds:
-            await self.cache_invites(guild)
+        # Cache invites for all guilds, a bounded number of requests at a time
+        semaphore = asyncio.Semaphore(INVITE_FETCH_CONCURRENCY)
+        
+        async def cache_one(guild: discord.Guild):
+            async with semaphore:
+                await self.cache_invites(guild)
+        
+        await asyncio.gather(*(cache_one(guild) for guild in self.bot.guilds), return_exceptions=True)
+    
+    async def cog_unload(self):
+        """Close the database connection."""
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
     
     async def setup_database(self):
         """Create database tables if they don't exist."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS invites (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    inviter_id INTEGER,
-                    invite_code TEXT,
-                    joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    left_at TIMESTAMP,
-                    is_fake INTEGER DEFAULT 0,
-                    PRIMARY KEY (guild_id, user_id, joined_at)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS invite_stats (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    total_invites INTEGER DEFAULT 0,
-                    left_invites INTEGER DEFAULT 0,
-                    fake_invites INTEGER DEFAULT 0,
-                    PRIMARY KEY (guild_id, user_id)
-                )
-            """)
-            
-            await db.commit()
+        db = self.db
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS invites (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                inviter_id INTEGER,
+                invite_code TEXT,
+                joined_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                left_at INTEGER,
+                is_fake INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, user_id, joined_at)
+            )
+        """)
+        
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS invite_stats (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                total_invites INTEGER DEFAULT 0,
+                left_invites INTEGER DEFAULT 0,
+                fake_invites INTEGER DEFAULT 0,
+                valid_invites INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, user_id)
+            )
+        """)
+        
+        # Databases created before valid_invites existed: add and backfill it
+        async with db.execute("PRAGMA table_info(invite_stats)") as cursor:
+            columns = {row[1] for row in await cursor.fetchall()}
+        if "valid_invites" not in columns:
+            await db.execute("ALTER TABLE invite_stats ADD COLUMN valid_invites INTEGER DEFAULT 0")
+            await db.execute("UPDATE invite_stats SET valid_invites = total_invites - left_invites - fake_invites")
+        
+        # Timestamps used to be stored as 'YYYY-MM-DD HH:MM:SS' text; convert them to unix seconds
+        await db.execute("""
+            UPDATE invites SET joined_at = CAST(strftime('%s', joined_at) AS INTEGER)
+            WHERE typeof(joined_at) = 'text'
+        """)
+        await db.execute("""
+            UPDATE invites SET left_at = CAST(strftime('%s', left_at) AS INTEGER)
+            WHERE typeof(left_at) = 'text'
+        """)
+        
+        # invitedlist filters by inviter; the primary key only covers lookups by invited user
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_invites_inviter
+            ON invites (guild_id, inviter_id, joined_at DESC)
+        """)
+        # Members still in the guild, the only rows on_member_remove looks at
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_invites_active
+            ON invites (guild_id, user_id, joined_at)
+            WHERE left_at IS NULL
+        """)
+        
+        # Lets the leaderboard read its top rows straight off the index instead of sorting
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_invite_stats_leaderboard
+            ON invite_stats (guild_id, valid_invites DESC)
+        """)
+        
+        await db.commit()
     
     async def cache_invites(self, guild: discord.Guild):
         """Cache all invites for a guild."""
         try:
             invites = await guild.invites()
-            self.invite_cache[guild.id] = {invite.code: invite for invite in invites}
+            self.invite_cache[guild.id] = {invite.code: invite.uses or 0 for invite in invites}
         except discord.Forbidden:
             pass  # Bot doesn't have permission to view invites
     
     async def get_invite_stats(self, guild_id: int, user_id: int) -> Dict[str, int]:
         """Get invite statistics for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT total_invites, left_invites, fake_invites
-                FROM invite_stats
-                WHERE guild_id = ? AND user_id = ?
-            """, (guild_id, user_id)) as cursor:
-                row = await cursor.fetchone()
-                if row:
-                    return {
-                        "total": row[0],
-                        "left": row[1],
-                        "fake": row[2],
-                        "valid": row[0] - row[1] - row[2]
-                    }
-                return {"total": 0, "left": 0, "fake": 0, "valid": 0}
+        key = (guild_id, user_id)
+        cached = self._stats_cache.get(key)
+        if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            return dict(cached[1])
+        
+        db = self.db
+        async with db.execute("""
+            SELECT total_invites, left_invites, fake_invites
+            FROM invite_stats
+            WHERE guild_id = ? AND user_id = ?
+        """, (guild_id, user_id)) as cursor:
+            row = await cursor.fetchone()
+        if row:
+            stats = {
+                "total": row[0],
+                "left": row[1],
+                "fake": row[2],
+                "valid": row[0] - row[1] - row[2]
+            }
+        else:
+            stats = {"total": 0, "left": 0, "fake": 0, "valid": 0}
+        self._stats_cache[key] = (time.monotonic(), stats)
+        return dict(stats)
+    
+    async def get_leaderboard_rows(self, guild_id: int) -> List[tuple]:
+        """Get the top 15 (user_id, total, left, fake) rows by valid invites."""
+        cached = self._lb_cache.get(guild_id)
+        if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            return cached[1]
+        
+        db = self.db
+        async with db.execute("""
+            SELECT user_id, total_invites, left_invites, fake_invites
+            FROM invite_stats
+            WHERE guild_id = ?
+            ORDER BY valid_invites DESC
+            LIMIT 15
+        """, (guild_id,)) as cursor:
+            rows = list(await cursor.fetchall())
+        self._lb_cache[guild_id] = (time.monotonic(), rows)
+        return rows
     
     async def update_invite_stats(self, guild_id: int, user_id: int, 
                                   total_delta: int = 0, left_delta: int = 0, fake_delta: int = 0):
-        """Update invite statistics for a user."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                INSERT INTO invite_stats (guild_id, user_id, total_invites, left_invites, fake_invites)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(guild_id, user_id) DO UPDATE SET
-                    total_invites = total_invites + ?,
-                    left_invites = left_invites + ?,
-                    fake_invites = fake_invites + ?
-            """, (guild_id, user_id, total_delta, left_delta, fake_delta, 
-                  total_delta, left_delta, fake_delta))
-            await db.commit()
+        """Update invite statistics for a user.
+
+        Callers must hold `write_lock` and commit; this runs inside their transaction.
+        """
+        valid_delta = total_delta - left_delta - fake_delta
+        db = self.db
+        await db.execute("""
+            INSERT INTO invite_stats (guild_id, user_id, total_invites, left_invites, fake_invites, valid_invites)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(guild_id, user_id) DO UPDATE SET
+                total_invites = total_invites + ?,
+                left_invites = left_invites + ?,
+                fake_invites = fake_invites + ?,
+                valid_invites = valid_invites + ?
+        """, (guild_id, user_id, total_delta, left_delta, fake_delta, valid_delta,
+              total_delta, left_delta, fake_delta, valid_delta))
+        self._stats_cache.pop((guild_id, user_id), None)
+        self._lb_cache.pop(guild_id, None)
+    
+    async def reconcile_invite_stats(self, guild_id: int) -> int:
+        """Recount a guild's invite stats from the recorded invites.
+
+        Returns the number of inviters whose stats were rewritten.
+        """
+        db = self.db
+        async with self.write_lock:
+            try:
+                # Same rules as the listeners: every join counts, leaves only when not fake
+                async with db.execute("""
+                    SELECT inviter_id,
+                           COUNT(*),
+                           SUM(left_at IS NOT NULL AND NOT is_fake),
+                           SUM(is_fake)
+                    FROM invites
+                    WHERE guild_id = ? AND inviter_id IS NOT NULL
+                    GROUP BY inviter_id
+                """, (guild_id,)) as cursor:
+                    rows = [
+                        (guild_id, inviter_id, total, left, fake, total - left - fake)
+                        for inviter_id, total, left, fake in await cursor.fetchall()
+                    ]
+            
+                await db.executemany("""
+                    INSERT INTO invite_stats (guild_id, user_id, total_invites, left_invites, fake_invites, valid_invites)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(guild_id, user_id) DO UPDATE SET
+                        total_invites = excluded.total_invites,
+                        left_invites = excluded.left_invites,
+                        fake_invites = excluded.fake_invites,
+                        valid_invites = excluded.valid_invites
+                """, rows)
+                await db.commit()
+            except BaseException:
+                await db.rollback()
+                raise
+        
+        self._lb_cache.pop(guild_id, None)
+        for key in [key for key in self._stats_cache if key[0] == guild_id]:
+            del self._stats_cache[key]
+        return len(rows)
     
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -113,39 +271,51 @@ class InviteTracker(commands.Cog):
         except discord.Forbidden:
             return
         
+        # No baseline for this guild (joined after load, or the fetch failed), so every
+        # invite would look new; seed the cache and leave this join unattributed
+        if guild.id not in self.invite_cache:
+            self.invite_cache[guild.id] = {invite.code: invite.uses or 0 for invite in current_invites}
+            return
+
         # Find which invite was used
-        cached_invites = self.invite_cache.get(guild.id, {})
+        cached_invites = self.invite_cache[guild.id]
         used_invite = None
         
+        # An invite missing from the cache was created since the last fetch, so count it from 0
         for invite in current_invites:
-            cached = cached_invites.get(invite.code)
-            if cached and invite.uses and cached.uses and invite.uses > cached.uses:
+            if (invite.uses or 0) > cached_invites.get(invite.code, 0):
                 used_invite = invite
                 break
         
-        # Update cache
-        await self.cache_invites(guild)
+        # Update cache from the list we already fetched rather than asking Discord again
+        self.invite_cache[guild.id] = {invite.code: invite.uses or 0 for invite in current_invites}
         
         if used_invite and used_invite.inviter:
             inviter_id = used_invite.inviter.id
             
             # Check for fake invites (account age < 7 days)
-            account_age = (datetime.utcnow() - member.created_at).days
-            is_fake = 1 if account_age < 7 else 0
-            
-            # Record the invite
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO invites (guild_id, user_id, inviter_id, invite_code, is_fake)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (guild.id, member.id, inviter_id, used_invite.code, is_fake))
-                await db.commit()
+            is_fake = 1 if time.time() - member.created_at.timestamp() < 7 * 86400 else 0
             
-            # Update stats
-            if is_fake:
-                await self.update_invite_stats(guild.id, inviter_id, total_delta=1, fake_delta=1)
-            else:
-                await self.update_invite_stats(guild.id, inviter_id, total_delta=1)
+            db = self.db
+            async with self.write_lock:
+                try:
+                    # Record the invite
+                    await db.execute("""
+                        INSERT INTO invites (guild_id, user_id, inviter_id, invite_code, joined_at, is_fake)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """, (guild.id, member.id, inviter_id, used_invite.code, int(time.time()), is_fake))
+
+                    # Update stats
+                    if is_fake:
+                        await self.update_invite_stats(guild.id, inviter_id, total_delta=1, fake_delta=1)
+                    else:
+                        await self.update_invite_stats(guild.id, inviter_id, total_delta=1)
+                    # One commit for the invite row and its stats
+                    await db.commit()
+                except BaseException:
+                    # Don't leave a half-applied join open for the next writer's commit
+                    await db.rollback()
+                    raise
     
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
@@ -155,28 +325,33 @@ class InviteTracker(commands.Cog):
         
         guild = member.guild
         
-        # Find who invited this member
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT inviter_id, is_fake FROM invites
-                WHERE guild_id = ? AND user_id = ? AND left_at IS NULL
-                ORDER BY joined_at DESC LIMIT 1
-            """, (guild.id, member.id)) as cursor:
-                row = await cursor.fetchone()
-                
-                if row:
-                    inviter_id, is_fake = row
-                    
-                    # Mark as left
-                    await db.execute("""
-                        UPDATE invites SET left_at = CURRENT_TIMESTAMP
-                        WHERE guild_id = ? AND user_id = ? AND left_at IS NULL
-                    """, (guild.id, member.id))
-                    await db.commit()
-                    
-                    # Update stats (only count as left if not fake)
-                    if not is_fake:
-                        await self.update_invite_stats(guild.id, inviter_id, left_delta=1)
+        db = self.db
+        async with self.write_lock:
+            try:
+                # Find who invited this member
+                async with db.execute("""
+                    SELECT inviter_id, is_fake FROM invites
+                    WHERE guild_id = ? AND user_id = ? AND left_at IS NULL
+                    ORDER BY joined_at DESC LIMIT 1
+                """, (guild.id, member.id)) as cursor:
+                    row = await cursor.fetchone()
+
+                    if row:
+                        inviter_id, is_fake = row
+
+                        # Mark as left
+                        await db.execute("""
+                            UPDATE invites SET left_at = ?
+                            WHERE guild_id = ? AND user_id = ? AND left_at IS NULL
+                        """, (int(time.time()), guild.id, member.id))
+
+                        # Update stats (only count as left if not fake)
+                        if not is_fake:
+                            await self.update_invite_stats(guild.id, inviter_id, left_delta=1)
+                        await db.commit()
+            except BaseException:
+                await db.rollback()
+                raise
     
     @commands.hybrid_command(name="invitecodes", description="View your invite codes and their usage statistics")
     async def invite_codes(self, ctx: commands.Context, member: Optional[discord.Member] = None):
@@ -248,18 +423,15 @@ class InviteTracker(commands.Cog):
             await ctx.send("This command can only be used in a server.")
             return
         
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT user_id, invite_code, joined_at, left_at, is_fake
-                FROM invites
-                WHERE guild_id = ? AND inviter_id = ?
-                ORDER BY joined_at DESC
-                LIMIT 25
-            """, (ctx.guild.id, target.id)) as cursor:
-                rows = await cursor.fetchall()
+        db = self.db
+        async with db.execute("""
+            SELECT COUNT(*), COALESCE(SUM(left_at IS NULL), 0)
+            FROM invites
+            WHERE guild_id = ? AND inviter_id = ?
+        """, (ctx.guild.id, target.id)) as cursor:
+            total, active_count = await cursor.fetchone()
         
-        rows_list = list(rows)
-        if not rows_list:
+        if not total:
             embed = discord.Embed(
                 title="Invited Members",
                 description=f"{target.mention} has not invited anyone yet.",
@@ -267,39 +439,44 @@ class InviteTracker(commands.Cog):
             )
             await ctx.send(embed=embed)
             return
+        left_count = total - active_count
         
         embed = discord.Embed(
             title=f"Invited Members - {target.display_name}",
-            description=f"Total Records: {len(rows_list)}",
+            description=f"Total Records: {total}",
             color=discord.Color.blue()
         )
         
-        active_members = []
-        left_members = []
-        
-        for row in rows_list:
-            user_id, code, joined_at, left_at, is_fake = row
-            member_obj = ctx.guild.get_member(user_id)
-            
-            if member_obj:
-                status = "Active"
-                if is_fake:
-                    status += " (Flagged)"
-                active_members.append(f"<@{user_id}> - {status}")
-            else:
-                left_members.append(f"<@{user_id}> - Left")
-        
-        if active_members:
+        if active_count:
+            async with db.execute("""
+                SELECT user_id, is_fake
+                FROM invites
+                WHERE guild_id = ? AND inviter_id = ? AND left_at IS NULL
+                ORDER BY joined_at DESC
+                LIMIT 15
+            """, (ctx.guild.id, target.id)) as cursor:
+                active_members = [
+                    f"<@{user_id}> - Active" + (" (Flagged)" if is_fake else "")
+                    for user_id, is_fake in await cursor.fetchall()
+                ]
             embed.add_field(
-                name=f"Active Members ({len(active_members)})",
-                value="\n".join(active_members[:15]) or "None",
+                name=f"Active Members ({active_count})",
+                value="\n".join(active_members) or "None",
                 inline=False
             )
         
-        if left_members:
+        if left_count:
+            async with db.execute("""
+                SELECT user_id
+                FROM invites
+                WHERE guild_id = ? AND inviter_id = ? AND left_at IS NOT NULL
+                ORDER BY joined_at DESC
+                LIMIT 10
+            """, (ctx.guild.id, target.id)) as cursor:
+                left_members = [f"<@{user_id}> - Left" for (user_id,) in await cursor.fetchall()]
             embed.add_field(
-                name=f"Left Members ({len(left_members)})",
-                value="\n".join(left_members[:10]) or "None",
+                name=f"Left Members ({left_count})",
+                value="\n".join(left_members) or "None",
                 inline=False
             )
         
@@ -314,14 +491,14 @@ class InviteTracker(commands.Cog):
             await ctx.send("This command can only be used in a server.")
             return
         
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT inviter_id, invite_code, joined_at, is_fake
-                FROM invites
-                WHERE guild_id = ? AND user_id = ?
-                ORDER BY joined_at DESC LIMIT 1
-            """, (ctx.guild.id, target.id)) as cursor:
-                row = await cursor.fetchone()
+        db = self.db
+        async with db.execute("""
+            SELECT inviter_id, invite_code, joined_at, is_fake
+            FROM invites
+            WHERE guild_id = ? AND user_id = ?
+            ORDER BY joined_at DESC LIMIT 1
+        """, (ctx.guild.id, target.id)) as cursor:
+            row = await cursor.fetchone()
         
         embed = discord.Embed(
             title="Invite Information",
@@ -335,7 +512,7 @@ class InviteTracker(commands.Cog):
             embed.description = f"Invitation details for {target.mention}"
             embed.add_field(name="Invited By", value=inviter.mention if inviter else f"User ID: {inviter_id}", inline=True)
             embed.add_field(name="Invite Code", value=f"`{code}`", inline=True)
-            embed.add_field(name="Joined At", value=f"<t:{int(datetime.fromisoformat(joined_at).timestamp())}:F>", inline=False)
+            embed.add_field(name="Joined At", value=f"<t:{joined_at}:F>", inline=False)
             
             if is_fake:
                 embed.add_field(
@@ -355,15 +532,7 @@ class InviteTracker(commands.Cog):
             await ctx.send("This command can only be used in a server.")
             return
         
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute("""
-                SELECT user_id, total_invites, left_invites, fake_invites
-                FROM invite_stats
-                WHERE guild_id = ?
-                ORDER BY (total_invites - left_invites - fake_invites) DESC
-                LIMIT 15
-            """, (ctx.guild.id,)) as cursor:
-                rows = await cursor.fetchall()
+        rows = await self.get_leaderboard_rows(ctx.guild.id)
         
         if not rows:
             embed = discord.Embed(
@@ -381,6 +550,9 @@ class InviteTracker(commands.Cog):
         )
         
         leaderboard_text = []
+        # Guild.get_member is just a wrapper around this dict's get
+        get_member = ctx.guild._members.get
+        medals = self._MEDALS
         for idx, row in enumerate(rows, 1):
             user_id, total, left, fake = row
             valid = total - left - fake
@@ -388,10 +560,10 @@ class InviteTracker(commands.Cog):
             if valid <= 0:
                 continue
             
-            member = ctx.guild.get_member(user_id)
+            member = get_member(user_id)
             name = member.display_name if member else f"User {user_id}"
             
-            medal = ["🥇", "🥈", "🥉"][idx-1] if idx <= 3 else f"`{idx}.`"
+            medal = medals[idx-1] if idx <= 3 else f"`{idx}.`"
             leaderboard_text.append(
                 f"{medal} **{name}**\n"
                 f"Valid: {valid} | Total: {total} | Left: {left} | Fake: {fake}"
@@ -408,7 +580,7 @@ class InviteTracker(commands.Cog):
     @commands.hybrid_command(name="syncinvites", description="Synchronize invite cache with current server invites")
     @commands.has_permissions(manage_guild=True)
     async def sync_invites(self, ctx: commands.Context):
-        """Manually sync invite cache (requires Manage Server permission)."""
+        """Manually sync invite cache and recount invite stats (requires Manage Server permission)."""
         if not isinstance(ctx.guild, discord.Guild):
             await ctx.send("This command can only be used in a server.")
             return
@@ -419,10 +591,14 @@ class InviteTracker(commands.Cog):
             await self.cache_invites(ctx.guild)
             
             invite_count = len(self.invite_cache.get(ctx.guild.id, {}))
+            inviter_count = await self.reconcile_invite_stats(ctx.guild.id)
             
             embed = discord.Embed(
                 title="Invite Synchronization",
-                description=f"Successfully synchronized {invite_count} invite codes.",
+                description=(
+                    f"Successfully synchronized {invite_count} invite codes.\n"
+                    f"Recounted invite stats for {inviter_count} inviters."
+                ),
                 color=discord.Color.green()
             )
             
@@ -435,9 +611,9 @@ class InviteTracker(commands.Cog):
             )
             await ctx.send(embed=embed)
     
-    @commands.hybrid_command(name="invitedocs", description="View invite tracker documentation and GitHub repository")
-    async def documentation(self, ctx: commands.Context):
-        """Display documentation and links for the invite tracking system."""
+    @staticmethod
+    def _build_docs_embed() -> discord.Embed:
+        """Build the static invitedocs embed."""
         embed = discord.Embed(
             title="Invite Tracker Documentation",
             description=(
@@ -494,8 +670,12 @@ class InviteTracker(commands.Cog):
         )
         
         embed.set_footer(text="Eigen Bot • Invite Tracking System v1.0")
-        
-        await ctx.send(embed=embed)
+        return embed
+    
+    @commands.hybrid_command(name="invitedocs", description="View invite tracker documentation and GitHub repository")
+    async def documentation(self, ctx: commands.Context):
+        """Display documentation and links for the invite tracking system."""
+        await ctx.send(embed=self._docs_embed)
 
 
 async def setup(bot: commands.Bot):
@@ -7,14 +7,21 @@ from discord import app_commands
 from discord.ext import commands
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Optional, Tuple
 
 from models import User
 from utils.config import Config
 from utils.economy_utils import EconomyUtils
-from utils.helpers import EmbedBuilder, format_coins, responsible_gaming_notice
+from utils.helpers import EmbedBuilder, format_coins
 from bot import Fun2OoshBot
 
+# Spotify progress bars for every fill level, indexed by filled segments (0-20)
+PROGRESS_BAR_LENGTH = 20
+_PROGRESS_BARS = tuple(
+    "━" * filled + "○" + "─" * (PROGRESS_BAR_LENGTH - filled - 1)
+    for filled in range(PROGRESS_BAR_LENGTH + 1)
+)
+
 
 class Misc(commands.Cog):
     """Miscellaneous commands."""
@@ -22,10 +29,46 @@ class Misc(commands.Cog):
     def __init__(self, bot: Fun2OoshBot, config: Config):
         self.bot = bot
         self.config = config
+        # Members across all guilds, kept current by the listeners below;
+        # None until first needed (and again after a reconnect)
+        self._total_members: Optional[int] = None
+        # Static part of the about embed, as a dict for Embed.from_dict
+        self._about_template = self._build_about_template().to_dict()
 
-    @commands.hybrid_command(name='about', description='Learn about Eigen Bot')
-    async def about(self, ctx: commands.Context):
-        """Show information about the bot."""
+    def _about_stats(self) -> Tuple[int, int, int]:
+        """Server, user and command totals for the about embed."""
+        if self._total_members is None:
+            self._total_members = sum(guild.member_count or 0 for guild in self.bot.guilds)
+        return len(self.bot.guilds), self._total_members, len(self.bot.tree.get_commands())
+
+    def _adjust_members(self, delta: int):
+        if self._total_members is not None:
+            self._total_members += delta
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Guilds may have changed while disconnected; recount on next use
+        self._total_members = None
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self._adjust_members(guild.member_count or 0)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._adjust_members(-(guild.member_count or 0))
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._adjust_members(1)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._adjust_members(-1)
+
+    @staticmethod
+    def _build_about_template() -> discord.Embed:
+        """Build the parts of the about embed that never change."""
         embed = discord.Embed(
             title="📚 About Eigen Bot",
             description=(
@@ -36,21 +79,6 @@ class Misc(commands.Cog):
             color=discord.Color.blue()
         )
         
-        # Add bot stats
-        total_guilds = len(self.bot.guilds)
-        total_users = sum(guild.member_count or 0 for guild in self.bot.guilds)
-        total_commands = len(self.bot.tree.get_commands())
-        
-        embed.add_field(
-            name="📊 Statistics",
-            value=(
-                f"🏰 Servers: **{total_guilds}**\n"
-                f"👥 Users: **{total_users:,}**\n"
-                f"⚡ Commands: **{total_commands}**"
-            ),
-            inline=True
-        )
-        
         embed.add_field(
             name="🎯 Features",
             value=(
@@ -87,14 +115,36 @@ class Misc(commands.Cog):
         )
         
         # Add version and tech info
-        embed.set_footer(
-            text=f"Python {discord.__version__} • Made by TheCodeVerseHub",
-            icon_url=self.bot.user.avatar.url if self.bot.user and self.bot.user.avatar else None
-        )
+        embed.set_footer(text=f"Python {discord.__version__} • Made by TheCodeVerseHub")
+        return embed
+
+    @commands.hybrid_command(name='about', description='Learn about Eigen Bot')
+    async def about(self, ctx: commands.Context):
+        """Show information about the bot."""
+        # Add bot stats in front of the prebuilt fields; the field list is copied
+        # because from_dict shares it with the template
+        total_guilds, total_users, total_commands = self._about_stats()
+        
+        data = dict(self._about_template)
+        data['fields'] = [
+            {
+                'name': "📊 Statistics",
+                'value': (
+                    f"🏰 Servers: **{total_guilds}**\n"
+                    f"👥 Users: **{total_users:,}**\n"
+                    f"⚡ Commands: **{total_commands}**"
+                ),
+                'inline': True,
+            },
+            *data['fields'],
+        ]
+        embed = discord.Embed.from_dict(data)
         
-        # Set bot thumbnail
-        if self.bot.user and self.bot.user.avatar:
-            embed.set_thumbnail(url=self.bot.user.avatar.url)
+        # Footer icon and thumbnail follow the bot's current avatar
+        avatar = self.bot.user.avatar if self.bot.user else None
+        if avatar:
+            embed.set_footer(text=embed.footer.text, icon_url=avatar.url)
+            embed.set_thumbnail(url=avatar.url)
         
         await ctx.send(embed=embed)
 
@@ -113,9 +163,10 @@ class Misc(commands.Cog):
             await ctx.send(embed=embed)
             return
         
-        # Check all activities - be more comprehensive
+        # One pass: stop at Spotify, otherwise keep the first other listening activity
         spotify_activity = None
         music_activity = None
+        listening = discord.ActivityType.listening
         
         for activity in target_user.activities:
             # Check for Spotify specifically
@@ -123,7 +174,7 @@ class Misc(commands.Cog):
                 spotify_activity = activity
                 break
             # Check for any listening activity (including other music apps)
-            elif activity.type == discord.ActivityType.listening:
+            if music_activity is None and activity.type == listening:
                 music_activity = activity
         
         if spotify_activity:
@@ -154,17 +205,15 @@ class Misc(commands.Cog):
             )
             
             # Duration
-            duration = spotify_activity.duration
+            duration = spotify_activity.duration.total_seconds()
             current = (discord.utils.utcnow() - spotify_activity.start).total_seconds()
             
-            duration_str = f"{int(duration.total_seconds() // 60)}:{int(duration.total_seconds() % 60):02d}"
-            current_str = f"{int(current // 60)}:{int(current % 60):02d}"
+            duration_str = "{}:{:02d}".format(*divmod(int(duration), 60))
+            current_str = "{}:{:02d}".format(*divmod(int(current), 60))
             
             # Progress bar
-            progress = min(current / duration.total_seconds(), 1.0)
-            bar_length = 20
-            filled = int(bar_length * progress)
-            bar = "━" * filled + "○" + "─" * (bar_length - filled - 1)
+            progress = min(current / duration, 1.0)
+            bar = _PROGRESS_BARS[max(int(PROGRESS_BAR_LENGTH * progress), 0)]
             
             embed.add_field(
                 name="⏱️ Duration",
@@ -176,8 +225,6 @@ class Misc(commands.Cog):
             if spotify_activity.album_cover_url:
                 embed.set_thumbnail(url=spotify_activity.album_cover_url)
             
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            
         elif music_activity:
             # Found other music activity (not Spotify)
             if True:
@@ -194,16 +241,14 @@ class Misc(commands.Cog):
                     inline=False
                 )
                 
-                # Use getattr to safely access optional attributes
-                details = getattr(music_activity, 'details', None)
+                # Only discord.Activity carries the listening type, so these always exist (possibly None)
+                details = music_activity.details
                 if details:
                     embed.add_field(name="Details", value=details, inline=False)
                 
-                state = getattr(music_activity, 'state', None)
+                state = music_activity.state
                 if state:
                     embed.add_field(name="State", value=state, inline=False)
-                
-                embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
         else:
             # No music activity found - show debug info
             if target_user == ctx.author:
@@ -245,6 +290,11 @@ class Misc(commands.Cog):
             )
             embed.set_footer(text="Tip: Check Discord Settings → Activity Privacy → Display current activity")
         
+        if spotify_activity or music_activity:
+            # Both now-playing embeds credit the requester
+            author = ctx.author
+            embed.set_footer(text=f"Requested by {author.display_name}", icon_url=author.display_avatar.url)
+        
         await ctx.send(embed=embed)
 
 
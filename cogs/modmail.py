@@ -2,12 +2,15 @@
 Modmail cog: Users DM the bot, messages are forwarded to a modmail channel. Mods can reply from the channel.
 """
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 from utils.config import Config
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import asyncio
 import json
+import time
+from collections import OrderedDict, defaultdict
+from enum import IntEnum
 from pathlib import Path
 from datetime import datetime, timedelta
 import logging
@@ -15,12 +18,32 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class SessionState(IntEnum):
+    """Modmail session states; persisted to JSON as their int values."""
+    OPEN = 1
+    LOCKED = 2
+    RESOLVED = 3
+
+    @classmethod
+    def parse(cls, raw: Any) -> "SessionState":
+        """Read a persisted state, accepting the older 'open'/'locked'/'resolved' strings."""
+        if isinstance(raw, str):
+            return cls[raw.upper()]
+        return cls(raw)
+
+
 class ModMail(commands.Cog):
     # Session format per user_id:
-    # { 'state': 'open'|'locked'|'resolved', 'reset_at': ISO8601 timestamp or None }
-    modmail_sessions: Dict[int, Dict[str, Any]] = {}
-    _session_locks: Dict[int, asyncio.Lock] = {}
+    # { 'state': SessionState, 'reset_at': ISO8601 timestamp or None,
+    #   'touched_at': unix time of the last state change }
     SESSIONS_FILE = Path("data/modmail_sessions.json")
+    # Least recently used sessions are evicted beyond this many
+    MAX_SESSIONS = 10_000
+    # Users fetched over REST for ?reply_modmail, kept briefly so back-to-back replies don't refetch
+    USER_CACHE_TTL = 600
+    USER_CACHE_SIZE = 1024
+    # A locked user who keeps DMing is reminded at most this often
+    LOCKED_NOTICE_INTERVAL = 30
 
     def __init__(self, bot: commands.Bot, config: Config):
         self.bot = bot
@@ -28,12 +51,42 @@ class ModMail(commands.Cog):
         self.modmail_channel_id: Optional[int] = getattr(config, 'modmail_channel_id', None)
         # Configurable reset delay (seconds)
         self.RESET_DELAY_SECONDS: int = getattr(config, 'MODMAIL_RESET_SECONDS', 600)
+        # Sessions untouched for this long are dropped, so abandoned ones don't pile up
+        self.SESSION_TTL_SECONDS: int = getattr(config, 'MODMAIL_SESSION_TTL_SECONDS', 86400)
+        # Per instance, ordered oldest-used first so eviction can pop from the front
+        self.modmail_sessions: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._user_cache: Dict[int, Tuple[float, discord.User]] = {}
+        # Serializes on_message per user so spammed DMs don't race on their session
+        self._dm_locks: "defaultdict[int, asyncio.Lock]" = defaultdict(asyncio.Lock)
+        self._last_notice: Dict[int, float] = {}
         # Load persisted sessions if present
         try:
             self._load_sessions_from_file()
         except Exception:
             logger.exception("modmail: failed to load persisted sessions")
 
+    async def cog_load(self):
+        self.prune_sessions.start()
+
+    async def cog_unload(self):
+        self.prune_sessions.cancel()
+
+    @tasks.loop(hours=1)
+    async def prune_sessions(self):
+        """Drop sessions nobody has touched within SESSION_TTL_SECONDS."""
+        cutoff = time.time() - self.SESSION_TTL_SECONDS
+        stale = [uid for uid, session in self.modmail_sessions.items() if session.get('touched_at', 0) <= cutoff]
+        if stale:
+            for uid in stale:
+                del self.modmail_sessions[uid]
+            self._persist_sessions_to_file()
+            logger.info(f"modmail: pruned {len(stale)} stale sessions")
+        # Drop per-user bookkeeping for users who no longer have a session
+        for uid in [uid for uid, lock in self._dm_locks.items() if uid not in self.modmail_sessions and not lock.locked()]:
+            del self._dm_locks[uid]
+        for uid in [uid for uid in self._last_notice if uid not in self.modmail_sessions]:
+            del self._last_notice[uid]
+
     # Persistence helpers
     def _load_sessions_from_file(self):
         if not self.SESSIONS_FILE.exists():
@@ -41,10 +94,15 @@ class ModMail(commands.Cog):
         try:
             with self.SESSIONS_FILE.open("r", encoding="utf-8") as fh:
                 data = json.load(fh)
-            # Convert keys back to int
+            # Convert keys back to int, skipping sessions that expired while offline
+            now = time.time()
             for k, v in data.items():
                 try:
-                    self.modmail_sessions[int(k)] = v
+                    # Sessions saved before touched_at existed count as fresh
+                    v.setdefault('touched_at', now)
+                    v['state'] = SessionState.parse(v['state'])
+                    if now - v['touched_at'] < self.SESSION_TTL_SECONDS:
+                        self.modmail_sessions[int(k)] = v
                 except Exception:
                     logger.exception(f"modmail: failed to load session for key {k}")
         except Exception:
@@ -61,6 +119,61 @@ class ModMail(commands.Cog):
         except Exception:
             logger.exception("modmail: failed to persist sessions to file")
 
+    def _get_session(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Return a user's session, dropping it if it outlived SESSION_TTL_SECONDS."""
+        session = self.modmail_sessions.get(user_id)
+        if session is None:
+            return None
+        if time.time() - session.get('touched_at', 0) >= self.SESSION_TTL_SECONDS:
+            self._clear_session(user_id)
+            return None
+        self.modmail_sessions.move_to_end(user_id)
+        return session
+
+    def _set_session(self, user_id: int, state: SessionState, reset_at: Optional[str] = None):
+        """Store a user's session state and persist it."""
+        self.modmail_sessions[user_id] = {'state': state, 'reset_at': reset_at, 'touched_at': time.time()}
+        if state is not SessionState.LOCKED:
+            self._last_notice.pop(user_id, None)
+        self.modmail_sessions.move_to_end(user_id)
+        while len(self.modmail_sessions) > self.MAX_SESSIONS:
+            self.modmail_sessions.popitem(last=False)
+        self._persist_sessions_to_file()
+
+    def _clear_session(self, user_id: int):
+        """Forget a user's session and persist the change."""
+        self._last_notice.pop(user_id, None)
+        if self.modmail_sessions.pop(user_id, None) is not None:
+            self._persist_sessions_to_file()
+
+    async def _resolve_user(self, user_id: int) -> discord.User:
+        """Look a user up in the client cache, then the fetch cache, then over REST."""
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user
+        cached = self._user_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < self.USER_CACHE_TTL:
+            return cached[1]
+        user = await self.bot.fetch_user(user_id)
+        self._user_cache.pop(user_id, None)
+        if len(self._user_cache) >= self.USER_CACHE_SIZE:
+            del self._user_cache[next(iter(self._user_cache))]
+        self._user_cache[user_id] = (time.monotonic(), user)
+        return user
+
+    async def _notify_resolved(self, moderator: discord.abc.User, user: discord.abc.User, response: str):
+        """Post a "ModMail Resolved" note to the modmail channel, if one is configured."""
+        if not self.modmail_channel_id:
+            return
+        channel = self.bot.get_channel(self.modmail_channel_id)
+        if channel and isinstance(channel, discord.TextChannel):
+            embed = discord.Embed(
+                title="ModMail Resolved",
+                description=f"Moderator {moderator.mention} has replied to {user.mention}'s modmail.\n\n**Reply:** {response}",
+                color=discord.Color.green()
+            )
+            await channel.send(embed=embed)
+
     class ConfirmView(discord.ui.View):
         def __init__(self, cog, user, message_content):
             super().__init__(timeout=600)  # 10 minutes
@@ -70,11 +183,7 @@ class ModMail(commands.Cog):
 
         async def on_timeout(self):
             # Reset session if no action in 10 minutes
-            self.cog.modmail_sessions.pop(self.user.id, None)
-            try:
-                self.cog._persist_sessions_to_file()
-            except Exception:
-                logger.exception(f"modmail: failed to persist session on timeout for {self.user.id}")
+            self.cog._clear_session(self.user.id)
 
         @discord.ui.button(label="Yes", style=discord.ButtonStyle.green)
         async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -97,11 +206,7 @@ class ModMail(commands.Cog):
             )
             await interaction.response.send_message(embed=sent_embed, ephemeral=False)
             # Lock the session until a moderator replies
-            self.cog.modmail_sessions[self.user.id] = {'state': 'locked', 'reset_at': None}
-            try:
-                self.cog._persist_sessions_to_file()
-            except Exception:
-                logger.exception(f"modmail: failed to persist session lock for {self.user.id}")
+            self.cog._set_session(self.user.id, SessionState.LOCKED)
             self.stop()
 
         @discord.ui.button(label="No", style=discord.ButtonStyle.red)
@@ -126,12 +231,11 @@ class ModMail(commands.Cog):
         user_id = message.author.id
 
         # Ensure single-threaded handling per user to avoid duplicate guideline sends
-        lock = self._session_locks.setdefault(user_id, asyncio.Lock())
-        async with lock:
-            session = self.modmail_sessions.get(user_id)
+        async with self._dm_locks[user_id]:
+            session = self._get_session(user_id)
 
             # If there is a resolved session with reset_at, check expiry
-            if isinstance(session, dict) and session.get('state') == 'resolved' and session.get('reset_at'):
+            if isinstance(session, dict) and session.get('state') is SessionState.RESOLVED and session.get('reset_at'):
                 try:
                     reset_at = datetime.fromisoformat(session['reset_at'])
                 except Exception:
@@ -139,11 +243,7 @@ class ModMail(commands.Cog):
                 now = datetime.utcnow()
                 if reset_at and now >= reset_at:
                     # expired - treat as brand new (clear session)
-                    self.modmail_sessions.pop(user_id, None)
-                    try:
-                        self._persist_sessions_to_file()
-                    except Exception:
-                        logger.exception(f"modmail: failed to persist session clear for {user_id}")
+                    self._clear_session(user_id)
                     session = None
 
             session_state = session.get('state') if isinstance(session, dict) else None
@@ -172,16 +272,12 @@ class ModMail(commands.Cog):
                 )
                 embed.set_footer(text="Please follow these guidelines to help moderators assist you faster")
                 await message.author.send(embed=embed)
-                self.modmail_sessions[user_id] = {'state': 'open', 'reset_at': None}
+                self._set_session(user_id, SessionState.OPEN)
                 logger.info(f"modmail: guidelines sent to user {user_id}")
-                try:
-                    self._persist_sessions_to_file()
-                except Exception:
-                    logger.exception(f"modmail: failed to persist session after guidelines for {user_id}")
                 return
 
             # If session is resolved and not expired, behave like 'open' (ask confirmation to continue existing thread)
-            if session_state == 'resolved':
+            if session_state is SessionState.RESOLVED:
                 embed = discord.Embed(
                     title="Confirm ModMail Message",
                     description=f"Do you want to send this message to the moderators?\n\n**Message:** {message.content}",
@@ -192,7 +288,7 @@ class ModMail(commands.Cog):
                 logger.info(f"modmail: confirmation requested for user {user_id} (within reset window)")
                 return
 
-            if session_state == 'open':
+            if session_state is SessionState.OPEN:
                 embed = discord.Embed(
                     title="Confirm ModMail Message",
                     description=f"Do you want to send this message to the moderators?\n\n**Message:** {message.content}",
@@ -203,7 +299,12 @@ class ModMail(commands.Cog):
                 logger.info(f"modmail: confirmation requested for user {user_id}")
                 return
 
-            if session_state == 'locked':
+            if session_state is SessionState.LOCKED:
+                now = time.monotonic()
+                last = self._last_notice.get(user_id)
+                if last is not None and now - last < self.LOCKED_NOTICE_INTERVAL:
+                    return
+                self._last_notice[user_id] = now
                 try:
                     locked_embed = discord.Embed(
                         title="ModMail Locked",
@@ -219,7 +320,7 @@ class ModMail(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def reply_modmail(self, ctx: commands.Context, user_id: int, *, response: str):
         try:
-            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+            user = await self._resolve_user(user_id)
         except Exception:
             await ctx.send("User not found or not cached.")
             return
@@ -237,32 +338,22 @@ class ModMail(commands.Cog):
                 reply_embed.set_author(name=ctx.author.display_name, icon_url=avatar_url)
             except Exception:
                 pass
-            await user.send(embed=reply_embed)
-            await ctx.send("Reply sent.")
-            # Schedule reset in the future instead of immediately opening the session
-            reset_at = (datetime.utcnow() + timedelta(seconds=self.RESET_DELAY_SECONDS)).isoformat()
-            self.modmail_sessions[user_id] = {'state': 'resolved', 'reset_at': reset_at}
-            logger.info(f"modmail: scheduled reset for user {user_id} at {reset_at}")
             info_embed = discord.Embed(
                 title="You may send another message only if needed",
                 description="A Moderator has responded. If you need to send another message your session is open. This session will reset after a short period of inactivity.",
                 color=discord.Color.blue()
             )
-            await user.send(embed=info_embed)
-            try:
-                self._persist_sessions_to_file()
-            except Exception:
-                logger.exception(f"modmail: failed to persist scheduled reset for {user_id}")
-            # Notify modmail channel
-            if self.modmail_channel_id:
-                channel = self.bot.get_channel(self.modmail_channel_id)
-                if channel and isinstance(channel, discord.TextChannel):
-                    embed = discord.Embed(
-                        title="ModMail Resolved",
-                        description=f"Moderator {ctx.author.mention} has replied to {user.mention}'s modmail.\n\n**Reply:** {response}",
-                        color=discord.Color.green()
-                    )
-                    await channel.send(embed=embed)
+            # Reply and follow-up notice go out as one DM
+            await user.send(embeds=[reply_embed, info_embed])
+            # Schedule reset in the future instead of immediately opening the session
+            reset_at = (datetime.utcnow() + timedelta(seconds=self.RESET_DELAY_SECONDS)).isoformat()
+            self._set_session(user_id, SessionState.RESOLVED, reset_at)
+            logger.info(f"modmail: scheduled reset for user {user_id} at {reset_at}")
+            # Confirm to the moderator and notify the modmail channel concurrently
+            await asyncio.gather(
+                ctx.send("Reply sent."),
+                self._notify_resolved(ctx.author, user, response)
+            )
         except Exception:
             await ctx.send("Failed to send DM. User may have DMs closed.")
 
@@ -300,31 +391,21 @@ class ModMail(commands.Cog):
                 reply_embed.set_author(name=interaction.user.display_name, icon_url=avatar_url)
             except Exception:
                 pass
-            await user.send(embed=reply_embed)
-            await interaction.response.send_message("Reply sent.", ephemeral=True)
-            reset_at = (datetime.utcnow() + timedelta(seconds=self.RESET_DELAY_SECONDS)).isoformat()
-            self.modmail_sessions[user.id] = {'state': 'resolved', 'reset_at': reset_at}
-            logger.info(f"modmail: scheduled reset for user {user.id} at {reset_at}")
             info_embed = discord.Embed(
                 title="You may send another message soon",
                 description="A moderator has responded. If you need to send another message, your session is open. This session will reset after a short period of inactivity.",
                 color=discord.Color.blue()
             )
-            await user.send(embed=info_embed)
-            try:
-                self._persist_sessions_to_file()
-            except Exception:
-                logger.exception(f"modmail: failed to persist scheduled reset for {user.id}")
-            # Notify modmail channel
-            if self.modmail_channel_id:
-                channel = self.bot.get_channel(self.modmail_channel_id)
-                if channel and isinstance(channel, discord.TextChannel):
-                    embed = discord.Embed(
-                        title="ModMail Resolved",
-                        description=f"Moderator {interaction.user.mention} has replied to {user.mention}'s modmail.\n\n**Reply:** {response}",
-                        color=discord.Color.green()
-                    )
-                    await channel.send(embed=embed)
+            # Reply and follow-up notice go out as one DM
+            await user.send(embeds=[reply_embed, info_embed])
+            reset_at = (datetime.utcnow() + timedelta(seconds=self.RESET_DELAY_SECONDS)).isoformat()
+            self._set_session(user.id, SessionState.RESOLVED, reset_at)
+            logger.info(f"modmail: scheduled reset for user {user.id} at {reset_at}")
+            # Confirm to the moderator and notify the modmail channel concurrently
+            await asyncio.gather(
+                interaction.response.send_message("Reply sent.", ephemeral=True),
+                self._notify_resolved(interaction.user, user, response)
+            )
         except Exception:
             await interaction.response.send_message("Failed to send DM. User may have DMs closed.", ephemeral=True)
 
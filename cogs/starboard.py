@@ -9,7 +9,11 @@ from discord.ext import commands
 from discord import app_commands
 import aiosqlite
 import asyncio
-from datetime import datetime, timezone
+import bisect
+import json
+import time
+from collections import OrderedDict, defaultdict
+from enum import Enum
 from typing import Optional, Dict, Tuple
 import os
 from pathlib import Path
@@ -17,6 +21,90 @@ from utils.helpers import create_success_embed, create_error_embed, create_warni
 from types import SimpleNamespace
 from typing import Any
 
+# Applied once to the cog's shared connection; WAL keeps stats reads from
+# blocking reaction writes and NORMAL sync skips an fsync on every commit
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    # Checkpoint the WAL back into the main file every ~1000 pages so it stays small
+    "PRAGMA wal_autocheckpoint=1000",
+    # Read pages through a memory map (up to 256 MB) rather than copying them via read()
+    "PRAGMA mmap_size=268435456",
+    # Wait for a lock held by another connection (e.g. a backup or sqlite3 shell) instead of failing
+    "PRAGMA busy_timeout=5000",
+)
+
+# Stored in PRAGMA user_version; init_database migrates databases older than this
+SCHEMA_VERSION = 1
+
+# Before schema version 1 these tables kept timestamps as ISO-8601 text in TEXT columns.
+# table -> (all columns in order, the timestamp columns among them)
+_TEXT_TIMESTAMP_TABLES = {
+    'starboard_settings': (
+        ('guild_id', 'channel_id', 'threshold', 'star_emoji', 'enabled', 'self_star', 'created_at'),
+        ('created_at',),
+    ),
+    'starred_messages': (
+        ('message_id', 'guild_id', 'channel_id', 'author_id', 'starboard_message_id',
+         'star_count', 'content', 'attachments', 'created_at', 'last_updated'),
+        ('created_at', 'last_updated'),
+    ),
+    'user_stars': (
+        ('id', 'message_id', 'user_id', 'guild_id', 'starred_at'),
+        ('starred_at',),
+    ),
+}
+
+# Columns update_starboard_settings may write
+_ALLOWED_SETTING_KEYS = frozenset({'channel_id', 'threshold', 'star_emoji', 'enabled', 'self_star'})
+
+# Reaction-path statements. Each keeps one fixed SQL text, so sqlite3's per-connection
+# statement cache reuses the prepared statement instead of re-parsing it; the batch
+# lookup passes its ids as one JSON array rather than a variable-length IN (?, ?, ...)
+_SQL_INSERT_USER_STAR = """
+    INSERT OR IGNORE INTO user_stars (message_id, user_id, guild_id, starred_at)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_DELETE_USER_STAR = "DELETE FROM user_stars WHERE message_id = ? AND user_id = ?"
+# Star count, existing starboard post and the count it shows (NULLs if none) for each message id
+_SQL_STAR_STATE = """
+    SELECT ids.value,
+           (SELECT COUNT(*) FROM user_stars WHERE message_id = ids.value),
+           sm.starboard_message_id, sm.star_count
+    FROM json_each(?) AS ids
+    LEFT JOIN starred_messages AS sm ON sm.message_id = ids.value
+"""
+_SQL_UPDATE_STAR_COUNT = "UPDATE starred_messages SET star_count = ?, last_updated = ? WHERE message_id = ?"
+_SQL_INSERT_STARRED = """
+    INSERT INTO starred_messages
+    (message_id, guild_id, channel_id, author_id, starboard_message_id,
+     star_count, content, attachments, created_at, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Seconds star changes are held so a burst of reactions lands in one transaction
+STAR_FLUSH_INTERVAL = 0.25
+
+# Starboard embed color by star count: below 5, 5+, 10+, 20+
+_TIER_THRESHOLDS = (5, 10, 20)
+_TIER_COLORS = (0xF7DC6F, 0x4ECDC4, 0xFF6B6B, 0xFFD700)
+
+# Cleanup's fetch_message probes in flight at once: overall, and against any one channel
+CLEANUP_MAX_IN_FLIGHT = 25
+CLEANUP_CHANNEL_CONCURRENCY = 8
+
+# Channels the client cache doesn't hold (e.g. archived threads) are fetched once and kept, up to this many
+FETCHED_CHANNEL_CACHE_SIZE = 256
+
+
+class EditResult(Enum):
+    """Outcome of editing an existing starboard post."""
+    UPDATED = 1
+    GONE = 2  # the post was deleted, so its row should go too
+    FAILED = 3  # the edit didn't land; the post still shows its old count
+
 
 class ReactionProxy:
     """Minimal reaction-like proxy used for raw events when message isn't cached."""
@@ -29,6 +117,15 @@ class StarboardSystem(commands.Cog):
     @commands.hybrid_command(name="starboard_info", description="Show starboard usage tips and quick setup guide")
     async def starboard_info(self, ctx: commands.Context):
         """Show starboard usage tips and quick setup guide"""
+        # Only the thumbnail and footer icon vary; the rest comes from the prebuilt template
+        embed = discord.Embed.from_dict(self._info_template)
+        embed.set_thumbnail(url=self.bot.user.avatar.url if self.bot.user and self.bot.user.avatar else None)
+        embed.set_footer(text="fun2oosh Bot • Modern Discord Experience", icon_url=ctx.author.display_avatar.url)
+        await ctx.send(embed=embed)
+
+    @staticmethod
+    def _build_info_embed() -> discord.Embed:
+        """Build the static part of the starboard_info embed."""
         embed = discord.Embed(
             title="⭐ Modern Starboard System",
             description=(
@@ -55,7 +152,6 @@ class StarboardSystem(commands.Cog):
             ),
             color=0xFFD700  # Gold color
         )
-        embed.set_thumbnail(url=self.bot.user.avatar.url if self.bot.user and self.bot.user.avatar else None)
         embed.add_field(
             name=" Pro Tips",
             value=(
@@ -66,78 +162,178 @@ class StarboardSystem(commands.Cog):
             ),
             inline=False
         )
-        embed.set_footer(text="fun2oosh Bot • Modern Discord Experience", icon_url=ctx.author.display_avatar.url)
-        await ctx.send(embed=embed)
+        return embed
+
     """Starboard system for highlighting popular messages with star reactions"""
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # In WAL mode SQLite keeps starboard.db-wal and starboard.db-shm next to this file;
+        # back up all three together, or checkpoint first
         self.database_path = Path("data/starboard.db")
         self.star_cache: Dict[int, Dict] = {}  # Cache for quick lookups
+        # starboard_info's text never changes, so build it once
+        self._info_template = self._build_info_embed().to_dict()
+        self.db: Optional[aiosqlite.Connection] = None
+        # Writes share one connection, so each write + commit runs alone
+        self.write_lock = asyncio.Lock()
+        # (message_id, user_id) -> (added, guild_id, starred_at); the latest reaction per user wins
+        self._pending_stars: Dict[Tuple[int, int], Tuple[bool, int, int]] = {}
+        # Messages with queued star changes, re-synced to the starboard after each flush
+        self._pending_messages: Dict[int, Any] = {}
+        self._pending_event = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+        # Set on unload; the flusher finishes its current batch and exits instead of being cancelled
+        self._closing = False
+        self._init_task: Optional[asyncio.Task] = None
+        # Oldest-used first, so eviction pops from the front
+        self._fetched_channels: "OrderedDict[int, Any]" = OrderedDict()
         self.ready = False
         
     async def cog_load(self):
-        """Initialize the starboard system when the cog loads"""
-        await self.init_database()
-        await self.load_starboard_cache()
+        """Initialize the starboard system in the background so loading the cog doesn't wait on the DB"""
+        self._init_task = asyncio.create_task(self._deferred_init())
+
+    async def _deferred_init(self):
+        """Open the database and warm the settings cache; reactions are ignored until this finishes."""
+        try:
+            # Ensure data directory exists
+            self.database_path.parent.mkdir(exist_ok=True)
+            # One connection for the cog's lifetime instead of a new thread + file open per query
+            self.db = await aiosqlite.connect(self.database_path)
+            for pragma in SQLITE_PRAGMAS:
+                await self.db.execute(pragma)
+            await self.init_database()
+            await self.load_starboard_cache()
+        except Exception:
+            self.logger.exception("❌ Starboard: Failed to initialize the database")
+            raise
+        self._flusher = asyncio.create_task(self._flush_loop())
         self.ready = True
+
+    async def cog_before_invoke(self, ctx: commands.Context):
+        """Hold commands until the database and settings cache are ready."""
+        if self._init_task is not None:
+            await self._init_task
+
+    async def cog_unload(self):
+        """Write any queued stars and close the database connection"""
+        self.ready = False
+        if self._init_task is not None and not self._init_task.done():
+            self._init_task.cancel()
+            try:
+                await self._init_task
+            except asyncio.CancelledError:
+                pass
+        if self._flusher is not None:
+            # Cancelling mid-flush would drop a batch already taken off the queue
+            self._closing = True
+            self._pending_event.set()
+            await self._flusher
+            self._flusher = None
+        if self.db is not None:
+            await self._flush_pending()
+            await self.db.close()
+            self.db = None
         
     async def init_database(self):
         """Initialize the starboard database"""
-        # Ensure data directory exists
-        self.database_path.parent.mkdir(exist_ok=True)
-        
-        async with aiosqlite.connect(self.database_path) as db:
-            # Starboard settings table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS starboard_settings (
-                    guild_id INTEGER PRIMARY KEY,
-                    channel_id INTEGER,
-                    threshold INTEGER DEFAULT 3,
-                    star_emoji TEXT DEFAULT '⭐',
-                    enabled BOOLEAN DEFAULT 1,
-                    self_star BOOLEAN DEFAULT 1,
-                    created_at TEXT NOT NULL
-                )
-            """)
-            
-            # Starred messages table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS starred_messages (
-                    message_id INTEGER PRIMARY KEY,
-                    guild_id INTEGER NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    author_id INTEGER NOT NULL,
-                    starboard_message_id INTEGER,
-                    star_count INTEGER DEFAULT 0,
-                    content TEXT,
-                    attachments TEXT,
-                    created_at TEXT NOT NULL,
-                    last_updated TEXT NOT NULL
-                )
-            """)
-            
-            # Individual stars table (to track who starred what)
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS user_stars (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    message_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    guild_id INTEGER NOT NULL,
-                    starred_at TEXT NOT NULL,
-                    UNIQUE(message_id, user_id)
-                )
-            """)
-            
-            await db.commit()
-            
-    async def load_starboard_cache(self):
-        """Load starboard settings into cache for quick access"""
-        async with aiosqlite.connect(self.database_path) as db:
-            cursor = await db.execute("SELECT guild_id, channel_id, threshold, star_emoji, enabled, self_star FROM starboard_settings")
-            rows = await cursor.fetchall()
+        db = self.db
+        async with db.execute("PRAGMA user_version") as cursor:
+            (version,) = await cursor.fetchone()
+        
+        legacy_tables = []
+        if version < 1:
+            # Text timestamp columns can't hold integers (TEXT affinity converts them), so move
+            # old tables aside, recreate them below with INTEGER columns and copy the rows over
+            async with db.execute("SELECT name FROM sqlite_master WHERE type = 'table'") as cursor:
+                existing = {row[0] for row in await cursor.fetchall()}
+            legacy_tables = [table for table in _TEXT_TIMESTAMP_TABLES if table in existing]
+            await db.execute("BEGIN")
+            for table in legacy_tables:
+                await db.execute(f"ALTER TABLE {table} RENAME TO {table}_v0")
+        
+        # Starboard settings table
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS starboard_settings (
+                guild_id INTEGER PRIMARY KEY,
+                channel_id INTEGER,
+                threshold INTEGER DEFAULT 3,
+                star_emoji TEXT DEFAULT '⭐',
+                enabled BOOLEAN DEFAULT 1,
+                self_star BOOLEAN DEFAULT 1,
+                created_at INTEGER NOT NULL
+            )
+        """)
+        
+        # Starred messages table
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS starred_messages (
+                message_id INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                author_id INTEGER NOT NULL,
+                starboard_message_id INTEGER,
+                star_count INTEGER DEFAULT 0,
+                content TEXT,
+                attachments TEXT,
+                created_at INTEGER NOT NULL,
+                last_updated INTEGER NOT NULL
+            )
+        """)
+        
+        # Individual stars table (to track who starred what)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS user_stars (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                message_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                guild_id INTEGER NOT NULL,
+                starred_at INTEGER NOT NULL,
+                UNIQUE(message_id, user_id)
+            )
+        """)
+        
+        for table in legacy_tables:
+            columns, timestamps = _TEXT_TIMESTAMP_TABLES[table]
+            select = ", ".join(
+                f"COALESCE(CAST(strftime('%s', {column}) AS INTEGER), CAST(strftime('%s', 'now') AS INTEGER))"
+                if column in timestamps else column
+                for column in columns
+            )
+            await db.execute(f"INSERT INTO {table} ({', '.join(columns)}) SELECT {select} FROM {table}_v0")
+            await db.execute(f"DROP TABLE {table}_v0")
+        
+        # Back the stats queries: top message by star count, and stars per user within a guild
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_starred_guild_count ON starred_messages(guild_id, star_count DESC)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_user_stars_guild_user ON user_stars(guild_id, user_id)")
+        # Covers cleanup's per-guild scan; message_id is the rowid, so every selected column is in the index
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_starred_guild_cleanup ON starred_messages(guild_id, channel_id, starboard_message_id)")
+        # Deleted starboard posts are cleared by their starboard message id; rows without
+        # a post never match that lookup, so they are left out of the index
+        await db.execute("DROP INDEX IF EXISTS idx_starred_starboard_msg")
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_starred_starboard_msg_posted ON starred_messages(starboard_message_id)
+            WHERE starboard_message_id IS NOT NULL
+        """)
+        
+        await db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        await db.commit()
+        
+        # Refresh planner statistics so the indexes get picked; the limit keeps this quick on big tables
+        await db.execute("PRAGMA analysis_limit=400")
+        await db.execute("ANALYZE")
             
-            for row in rows:
+    async def load_starboard_cache(self, guild_id: Optional[int] = None):
+        """Load starboard settings into cache for quick access (just one guild's, if given)"""
+        query = "SELECT guild_id, channel_id, threshold, star_emoji, enabled, self_star FROM starboard_settings"
+        params: Tuple = ()
+        if guild_id is not None:
+            query += " WHERE guild_id = ?"
+            params = (guild_id,)
+        # Stream rows in aiosqlite's chunks rather than materializing every guild at once
+        async with self.db.execute(query, params) as cursor:
+            async for row in cursor:
                 guild_id, channel_id, threshold, star_emoji, enabled, self_star = row
                 self.star_cache[guild_id] = {
                     'channel_id': channel_id,
@@ -146,56 +342,68 @@ class StarboardSystem(commands.Cog):
                     'enabled': bool(enabled),
                     'self_star': bool(self_star)
                 }
+                self._refresh_derived(self.star_cache[guild_id])
                 
-    async def get_starboard_settings(self, guild_id: int) -> Optional[Dict]:
-        """Get starboard settings for a guild"""
-        if guild_id in self.star_cache:
-            return self.star_cache[guild_id]
-        return None
+    @staticmethod
+    def _refresh_derived(entry: Dict):
+        """Precompute the cached fields the reaction path compares against."""
+        # star_emoji may list several accepted emojis separated by "|", e.g. "⭐|🌟"
+        entry['_star_set'] = frozenset(entry.get('star_emoji', '⭐').split('|'))
+
+    @staticmethod
+    def _is_star(emoji: Any, settings: Dict) -> bool:
+        """Whether a reaction emoji is one of the guild's star emojis."""
+        if isinstance(emoji, str):
+            key = emoji
+        elif emoji.id is None:
+            # Unicode emoji: the name is the character itself, no need to format the emoji
+            key = emoji.name
+        else:
+            # Custom emoji: matches the stored <:name:id> form
+            key = str(emoji)
+        return key in settings['_star_set']
+
+    def _settings(self, guild_id: int) -> Optional[Dict]:
+        """Get starboard settings for a guild.
+
+        The cache is loaded at startup and updated on every write, so it is
+        authoritative and the reaction path can read it without awaiting.
+        """
+        return self.star_cache.get(guild_id)
         
     async def update_starboard_settings(self, guild_id: int, **kwargs):
         """Update starboard settings for a guild"""
-        current_time = datetime.now(timezone.utc).isoformat()
-        
-        async with aiosqlite.connect(self.database_path) as db:
-            # Check if settings exist
-            cursor = await db.execute("SELECT guild_id FROM starboard_settings WHERE guild_id = ?", (guild_id,))
-            exists = await cursor.fetchone()
-            
-            if exists:
-                # Update existing settings
-                set_clauses = []
-                values = []
-                for key, value in kwargs.items():
-                    if key in ['channel_id', 'threshold', 'star_emoji', 'enabled', 'self_star']:
-                        set_clauses.append(f"{key} = ?")
-                        values.append(value)
-                
-                if set_clauses:
-                    query = f"UPDATE starboard_settings SET {', '.join(set_clauses)} WHERE guild_id = ?"
-                    values.append(guild_id)
-                    await db.execute(query, values)
-            else:
-                # Create new settings
-                await db.execute("""
-                    INSERT INTO starboard_settings (guild_id, channel_id, threshold, star_emoji, enabled, self_star, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    guild_id,
-                    kwargs.get('channel_id'),
-                    kwargs.get('threshold', 3),
-                    kwargs.get('star_emoji', '⭐'),
-                    kwargs.get('enabled', True),
-                    kwargs.get('self_star', True),
-                    current_time
-                ))
-            
+        current_time = int(time.time())
+        
+        # New guilds get defaults for anything not given; existing rows only change the given columns
+        changes = {key: value for key, value in kwargs.items() if key in _ALLOWED_SETTING_KEYS}
+        if changes:
+            on_conflict = "DO UPDATE SET " + ", ".join(f"{key} = excluded.{key}" for key in changes)
+        else:
+            on_conflict = "DO NOTHING"
+        
+        db = self.db
+        async with self.write_lock:
+            await db.execute(f"""
+                INSERT INTO starboard_settings (guild_id, channel_id, threshold, star_emoji, enabled, self_star, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(guild_id) {on_conflict}
+            """, (
+                guild_id,
+                changes.get('channel_id'),
+                changes.get('threshold', 3),
+                changes.get('star_emoji', '⭐'),
+                changes.get('enabled', True),
+                changes.get('self_star', True),
+                current_time
+            ))
             await db.commit()
             
         # Update cache
         if guild_id not in self.star_cache:
             self.star_cache[guild_id] = {}
-        self.star_cache[guild_id].update(kwargs)
+        self.star_cache[guild_id].update(changes)
+        self._refresh_derived(self.star_cache[guild_id])
 
     @commands.hybrid_group(name="starboard", description="Starboard system management")
     @commands.has_permissions(manage_guild=True)
@@ -285,7 +493,7 @@ class StarboardSystem(commands.Cog):
         if not ctx.guild:
             return
             
-        settings = await self.get_starboard_settings(ctx.guild.id)
+        settings = self._settings(ctx.guild.id)
         if not settings:
             await ctx.send(embed=create_error_embed(
                 "Starboard Not Setup",
@@ -310,7 +518,7 @@ class StarboardSystem(commands.Cog):
             await ctx.send(embed=create_error_embed("Invalid Threshold", "Threshold must be between 1 and 50."))
             return
             
-        settings = await self.get_starboard_settings(ctx.guild.id)
+        settings = self._settings(ctx.guild.id)
         if not settings:
             await ctx.send(embed=create_error_embed(
                 "Starboard Not Setup",
@@ -335,7 +543,7 @@ class StarboardSystem(commands.Cog):
             await ctx.send(embed=create_error_embed("Invalid Emoji", "Emoji must be 10 characters or less."))
             return
             
-        settings = await self.get_starboard_settings(ctx.guild.id)
+        settings = self._settings(ctx.guild.id)
         if not settings:
             await ctx.send(embed=create_error_embed(
                 "Starboard Not Setup",
@@ -355,7 +563,7 @@ class StarboardSystem(commands.Cog):
         if not ctx.guild:
             return
             
-        settings = await self.get_starboard_settings(ctx.guild.id)
+        settings = self._settings(ctx.guild.id)
         if not settings:
             await ctx.send(embed=create_error_embed(
                 "Starboard Not Setup",
@@ -382,7 +590,7 @@ class StarboardSystem(commands.Cog):
         if not ctx.guild:
             return
             
-        settings = await self.get_starboard_settings(ctx.guild.id)
+        settings = self._settings(ctx.guild.id)
         if not settings:
             await ctx.send(embed=create_error_embed(
                 "Starboard Not Setup",
@@ -390,43 +598,35 @@ class StarboardSystem(commands.Cog):
             ))
             return
             
-        async with aiosqlite.connect(self.database_path) as db:
-            # Get total starred messages
-            cursor = await db.execute(
-                "SELECT COUNT(*) FROM starred_messages WHERE guild_id = ?",
-                (ctx.guild.id,)
-            )
-            result = await cursor.fetchone()
-            total_starred = result[0] if result else 0
-            
-            # Get total stars given
-            cursor = await db.execute(
-                "SELECT COUNT(*) FROM user_stars WHERE guild_id = ?",
-                (ctx.guild.id,)
-            )
-            result = await cursor.fetchone()
-            total_stars = result[0] if result else 0
-            
-            # Get top starred message with more details
-            cursor = await db.execute("""
+        db = self.db
+        guild_params = (ctx.guild.id,)
+        # Queue all four reads at once rather than waiting on each thread hop in turn
+        starred_rows, stars_rows, top_rows, top_starers = await asyncio.gather(
+            # Total starred messages
+            db.execute_fetchall("SELECT COUNT(*) FROM starred_messages WHERE guild_id = ?", guild_params),
+            # Total stars given
+            db.execute_fetchall("SELECT COUNT(*) FROM user_stars WHERE guild_id = ?", guild_params),
+            # Top starred message with more details
+            db.execute_fetchall("""
                 SELECT star_count, message_id, author_id, content 
                 FROM starred_messages 
                 WHERE guild_id = ? 
                 ORDER BY star_count DESC 
                 LIMIT 1
-            """, (ctx.guild.id,))
-            top_message = await cursor.fetchone()
-            
-            # Get top 3 most active users (who give the most stars)
-            cursor = await db.execute("""
+            """, guild_params),
+            # Top 3 most active users (who give the most stars)
+            db.execute_fetchall("""
                 SELECT user_id, COUNT(*) as stars_given 
                 FROM user_stars 
                 WHERE guild_id = ? 
                 GROUP BY user_id 
                 ORDER BY stars_given DESC 
                 LIMIT 3
-            """, (ctx.guild.id,))
-            top_starers = await cursor.fetchall()
+            """, guild_params),
+        )
+        total_starred = starred_rows[0][0] if starred_rows else 0
+        total_stars = stars_rows[0][0] if stars_rows else 0
+        top_message = top_rows[0] if top_rows else None
             
         # Dynamic color based on activity level
         if total_stars >= 100:
@@ -526,7 +726,7 @@ class StarboardSystem(commands.Cog):
         if not ctx.guild:
             return
             
-        settings = await self.get_starboard_settings(ctx.guild.id)
+        settings = self._settings(ctx.guild.id)
         
         if not settings:
             embed = create_warning_embed(
@@ -557,40 +757,52 @@ class StarboardSystem(commands.Cog):
     # ==================== REACTION MONITORING ====================
     
     @commands.Cog.listener()
-    async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
-        """Handle star reactions being added"""
-        if not self.ready:
-            return
-        
-        # Only process if in a guild and not from bot
-        if not reaction.message.guild or user.bot:
-            return
-        
-        # Quick check if it might be a star emoji before doing heavy processing
-        settings = await self.get_starboard_settings(reaction.message.guild.id)
-        if settings and str(reaction.emoji) == settings.get('star_emoji', '⭐'):
-            self.logger.debug(f"⭐ Starboard: Star reaction added by {user.name} on message {reaction.message.id}")
-            await self.handle_star_reaction(reaction, user, added=True)
-        
+    async def on_guild_join(self, guild: discord.Guild):
+        """Restore settings for a guild the bot has rejoined"""
+        if self.ready:
+            await self.load_starboard_cache(guild.id)
+
     @commands.Cog.listener()
-    async def on_reaction_remove(self, reaction: discord.Reaction, user: discord.User):
-        """Handle star reactions being removed"""
-        if not self.ready:
-            return
-        
-        # Only process if in a guild and not from bot
-        if not reaction.message.guild or user.bot:
-            return
-        
-        # Quick check if it might be a star emoji before doing heavy processing
-        settings = await self.get_starboard_settings(reaction.message.guild.id)
-        if settings and str(reaction.emoji) == settings.get('star_emoji', '⭐'):
-            self.logger.debug(f"⭐ Starboard: Star reaction removed by {user.name} on message {reaction.message.id}")
-            await self.handle_star_reaction(reaction, user, added=False)
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Drop settings for a guild the bot has left; its rows stay in the database"""
+        self.star_cache.pop(guild.id, None)
+    
+    async def _get_channel(self, channel_id: int) -> Any:
+        """Look a channel up in the client cache, then the fetched-channel cache, then over REST."""
+        channel = self.bot.get_channel(channel_id)
+        if channel is not None:
+            return channel
+        channel = self._fetched_channels.get(channel_id)
+        if channel is not None:
+            self._fetched_channels.move_to_end(channel_id)
+            return channel
+        channel = await self.bot.fetch_channel(channel_id)
+        self._fetched_channels[channel_id] = channel
+        if len(self._fetched_channels) > FETCHED_CHANNEL_CACHE_SIZE:
+            self._fetched_channels.popitem(last=False)
+        return channel
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Forget a deleted channel that was fetched over REST."""
+        self._fetched_channels.pop(channel.id, None)
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
-        """Handle reactions added for uncached messages by fetching the message and delegating."""
+        """Handle star reactions being added"""
+        await self._handle_raw_reaction(payload, added=True)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        """Handle star reactions being removed"""
+        await self._handle_raw_reaction(payload, added=False)
+
+    async def _handle_raw_reaction(self, payload: discord.RawReactionActionEvent, added: bool):
+        """Resolve a raw reaction's message and user, then delegate to handle_star_reaction.
+
+        Raw events fire for cached and uncached messages alike, so they are the only
+        reaction listeners; listening to on_reaction_add too would process cached messages twice.
+        """
         if not self.ready:
             return
 
@@ -598,91 +810,29 @@ class StarboardSystem(commands.Cog):
         if payload.guild_id is None:
             return
 
-        settings = await self.get_starboard_settings(payload.guild_id)
+        settings = self._settings(payload.guild_id)
         if not settings or not settings.get('enabled', True):
             return
 
         # Quick emoji check to avoid extra fetches
         try:
-            if str(payload.emoji) != settings.get('star_emoji', '⭐'):
-                return
-        except Exception:
-            return
-
-        # Fetch channel and message (ensure channel supports fetch_message)
-        try:
-            channel = self.bot.get_channel(payload.channel_id) or await self.bot.fetch_channel(payload.channel_id)
-            if not hasattr(channel, 'fetch_message'):
+            if not self._is_star(payload.emoji, settings):
                 return
-            # Cast to Messageable for type checkers
-            from typing import cast
-            from discord.abc import Messageable
-            mchannel = cast(Messageable, channel)
-            message = await mchannel.fetch_message(payload.message_id)
         except Exception:
             return
 
-        # Try to find an existing Reaction object on the message; otherwise create a lightweight proxy
-        reaction_obj = None
-        for r in getattr(message, 'reactions', []):
-            if str(r.emoji) == str(payload.emoji):
-                reaction_obj = r
-                break
-
-        if reaction_obj is None:
-            reaction_obj = ReactionProxy(payload.emoji, message)
-
-        # Resolve user object
-        user = None
-        guild = self.bot.get_guild(payload.guild_id)
-        if guild:
-            user = guild.get_member(payload.user_id)
-
-        if user is None:
+        # Cached messages are used as-is; only uncached ones are fetched
+        message = discord.utils.get(self.bot.cached_messages, id=payload.message_id)
+        if message is None:
             try:
-                user = await self.bot.fetch_user(payload.user_id)
+                channel = await self._get_channel(payload.channel_id)
+                if not hasattr(channel, 'fetch_message'):
+                    return
+                message = await channel.fetch_message(payload.message_id)
             except Exception:
                 return
 
-        # Ensure user is a discord.User (convert Member if necessary)
-        if hasattr(user, 'user'):
-            user_obj = getattr(user, 'user')
-        else:
-            user_obj = user
-
-        await self.handle_star_reaction(reaction_obj, user_obj, added=True)
-
-    @commands.Cog.listener()
-    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
-        """Handle reaction removals for uncached messages."""
-        if not self.ready:
-            return
-
-        if payload.guild_id is None:
-            return
-
-        settings = await self.get_starboard_settings(payload.guild_id)
-        if not settings or not settings.get('enabled', True):
-            return
-
-        try:
-            if str(payload.emoji) != settings.get('star_emoji', '⭐'):
-                return
-        except Exception:
-            return
-
-        try:
-            channel = self.bot.get_channel(payload.channel_id) or await self.bot.fetch_channel(payload.channel_id)
-            if not hasattr(channel, 'fetch_message'):
-                return
-            # Cast to Messageable for type checkers
-            from typing import cast
-            from discord.abc import Messageable
-            mchannel = cast(Messageable, channel)
-            message = await mchannel.fetch_message(payload.message_id)
-        except Exception:
-            return
-
+        # Try to find an existing Reaction object on the message; otherwise create a lightweight proxy
         reaction_obj = None
         for r in getattr(message, 'reactions', []):
             if str(r.emoji) == str(payload.emoji):
@@ -692,10 +842,12 @@ class StarboardSystem(commands.Cog):
         if reaction_obj is None:
             reaction_obj = ReactionProxy(payload.emoji, message)
 
-        user = None
-        guild = self.bot.get_guild(payload.guild_id)
-        if guild:
-            user = guild.get_member(payload.user_id)
+        # Resolve user object; add events carry the member already
+        user = payload.member
+        if user is None:
+            guild = self.bot.get_guild(payload.guild_id)
+            if guild:
+                user = guild.get_member(payload.user_id)
 
         if user is None:
             try:
@@ -703,21 +855,26 @@ class StarboardSystem(commands.Cog):
             except Exception:
                 return
 
+        # Ensure user is a discord.User (convert Member if necessary)
         if hasattr(user, 'user'):
             user_obj = getattr(user, 'user')
         else:
             user_obj = user
 
-        await self.handle_star_reaction(reaction_obj, user_obj, added=False)
+        await self.handle_star_reaction(reaction_obj, user_obj, added=added)
         
     async def handle_star_reaction(self, reaction: Any, user: Any, added: bool):
-        """Process star reactions (add or remove) - assumes pre-validated emoji"""
+        """Process star reactions (add or remove)"""
         message = reaction.message
         
-        # Get starboard settings (should exist from pre-check)
-        settings = await self.get_starboard_settings(message.guild.id)
+        # Cheapest rejections first: most reactions aren't stars, so they leave here without touching the DB
+        settings = self._settings(message.guild.id)
         if not settings or not settings.get('enabled', True):
             return
+        if not self._is_star(reaction.emoji, settings):
+            return
+        if user.bot:
+            return
             
         # Skip bot messages in starboard channel to prevent loops
         if message.channel.id == settings.get('channel_id'):
@@ -727,83 +884,127 @@ class StarboardSystem(commands.Cog):
         if not settings.get('self_star', True) and user.id == message.author.id:
             return
             
-        # Handle the star
-        current_time = datetime.now(timezone.utc).isoformat()
-        
-        async with aiosqlite.connect(self.database_path) as db:
-            if added:
-                # Add star
-                try:
-                    await db.execute("""
-                        INSERT INTO user_stars (message_id, user_id, guild_id, starred_at)
-                        VALUES (?, ?, ?, ?)
-                    """, (message.id, user.id, message.guild.id, current_time))
-                    await db.commit()
-                    self.logger.debug(f"💫 Starboard: Star added to DB for message {message.id} by user {user.id}")
-                except Exception as e:
-                    # Star already exists, ignore (common duplicate insert)
-                    self.logger.debug(f"ℹ️ Starboard: Star already exists or error: {e}")
-                    return
-            else:
-                # Remove star
-                await db.execute("""
-                    DELETE FROM user_stars 
-                    WHERE message_id = ? AND user_id = ?
-                """, (message.id, user.id))
+        # Queue the star; the flusher writes it and updates the starboard shortly
+        current_time = int(time.time())
+        self._pending_stars[(message.id, user.id)] = (added, message.guild.id, current_time)
+        self._pending_messages[message.id] = message
+        self._pending_event.set()
+        self.logger.debug(f"💫 Starboard: Star {'added' if added else 'removed'} for message {message.id} by user {user.id}")
+
+    async def _flush_loop(self):
+        while not self._closing:
+            await self._pending_event.wait()
+            if not self._closing:
+                # Let the rest of a reaction burst join this batch
+                await asyncio.sleep(STAR_FLUSH_INTERVAL)
+            self._pending_event.clear()
+            try:
+                await self._flush_pending()
+            except Exception:
+                self.logger.exception("❌ Starboard: Failed to flush queued stars")
+
+    async def _flush_pending(self):
+        """Write queued star changes in one transaction, then re-sync each touched message."""
+        if not self._pending_stars:
+            return
+        pending, self._pending_stars = self._pending_stars, {}
+        messages, self._pending_messages = self._pending_messages, {}
+        
+        inserts = [(message_id, user_id, guild_id, starred_at)
+                   for (message_id, user_id), (added, guild_id, starred_at) in pending.items() if added]
+        deletes = [(message_id, user_id)
+                   for (message_id, user_id), (added, _, _) in pending.items() if not added]
+        
+        db = self.db
+        async with self.write_lock:
+            changes_before = db.total_changes
+            if inserts:
+                # Stars that already exist (e.g. a duplicate reaction event) are skipped
+                await db.executemany(_SQL_INSERT_USER_STAR, inserts)
+            if deletes:
+                await db.executemany(_SQL_DELETE_USER_STAR, deletes)
+            await db.commit()
+            changed = db.total_changes != changes_before
+        
+        if not changed:
+            return
+        
+        # Star count and existing starboard post for every touched message in one round trip
+        star_state = {
+            message_id: state
+            for message_id, *state
+            in await db.execute_fetchall(_SQL_STAR_STATE, (json.dumps(list(messages)),))
+        }
+        
+        row_writes = []
+        for message in messages.values():
+            try:
+                write = await self._sync_starboard(message, *star_state.get(message.id, (0, None, None)))
+            except Exception:
+                self.logger.exception(f"❌ Starboard: Failed to sync starboard for message {message.id}")
+                continue
+            if write is not None:
+                row_writes.append(write)
+        
+        # Every touched message's starred_messages change lands in one commit
+        if row_writes:
+            async with self.write_lock:
+                for sql, params in row_writes:
+                    await db.execute(sql, params)
                 await db.commit()
-                self.logger.debug(f"💫 Starboard: Star removed from DB for message {message.id} by user {user.id}")
-            
-            # Get current star count
-            cursor = await db.execute("""
-                SELECT COUNT(*) FROM user_stars WHERE message_id = ?
-            """, (message.id,))
-            result = await cursor.fetchone()
-            star_count = result[0] if result else 0
-            self.logger.debug(f"📊 Starboard: Message {message.id} now has {star_count} stars (threshold: {settings['threshold']})")
-            
-            # Check if message exists in starred_messages
-            cursor = await db.execute("""
-                SELECT starboard_message_id, star_count FROM starred_messages WHERE message_id = ?
-            """, (message.id,))
-            existing = await cursor.fetchone()
-            
-            threshold = settings['threshold']
-            
-            if star_count >= threshold:
-                if existing:
-                    # Update existing starboard message
-                    self.logger.debug(f"📝 Starboard: Updating message {message.id} with {star_count} stars")
-                    await self.update_starboard_message(message, star_count, existing[0], settings)
-                    await db.execute("""
-                        UPDATE starred_messages 
-                        SET star_count = ?, last_updated = ?
-                        WHERE message_id = ?
-                    """, (star_count, current_time, message.id))
-                else:
-                    # Create new starboard message
-                    self.logger.debug(f"⭐ Starboard: Creating new starboard message for {message.id} with {star_count} stars (threshold: {threshold})")
-                    starboard_msg_id = await self.create_starboard_message(message, star_count, settings)
-                    if starboard_msg_id:
-                        self.logger.debug(f"✅ Starboard: Created message {starboard_msg_id} in starboard channel")
-                        await db.execute("""
-                            INSERT INTO starred_messages 
-                            (message_id, guild_id, channel_id, author_id, starboard_message_id, 
-                             star_count, content, attachments, created_at, last_updated)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            message.id, message.guild.id, message.channel.id, message.author.id,
-                            starboard_msg_id, star_count, message.content or "", 
-                            str([att.url for att in message.attachments]), current_time, current_time
-                        ))
-                    else:
-                        self.logger.error(f"❌ Starboard: Failed to create starboard message for {message.id}")
+
+    async def _sync_starboard(self, message: Any, star_count: int, starboard_msg_id: Optional[int],
+                              posted_count: Optional[int] = None) -> Optional[Tuple[str, Tuple]]:
+        """Post, update or remove a message's starboard entry to match its current star count.
+
+        `starboard_msg_id` is the message's existing starboard post, or None if it has none,
+        and `posted_count` the star count that post last showed.
+        Returns the starred_messages write to apply as (sql, params), or None; the caller
+        commits them together.
+        """
+        settings = self._settings(message.guild.id)
+        if not settings or not settings.get('enabled', True):
+            return None
+        current_time = int(time.time())
+        self.logger.debug(f"📊 Starboard: Message {message.id} now has {star_count} stars (threshold: {settings['threshold']})")
+        
+        threshold = settings['threshold']
+        
+        if star_count >= threshold:
+            if starboard_msg_id is not None:
+                # Stars added and removed within the batch can net out; the post is already right
+                if star_count == posted_count:
+                    return None
+                # Update existing starboard message
+                self.logger.debug(f"📝 Starboard: Updating message {message.id} with {star_count} stars")
+                result = await self.update_starboard_message(message, star_count, starboard_msg_id, settings)
+                if result is EditResult.GONE:
+                    # Starboard message was deleted, remove from database
+                    return "DELETE FROM starred_messages WHERE starboard_message_id = ?", (starboard_msg_id,)
+                if result is EditResult.FAILED:
+                    # Keep the old count so the next star change retries the edit
+                    return None
+                return _SQL_UPDATE_STAR_COUNT, (star_count, current_time, message.id)
             else:
-                if existing and star_count < threshold:
-                    # Remove from starboard if below threshold
-                    await self.remove_starboard_message(existing[0], settings)
-                    await db.execute("DELETE FROM starred_messages WHERE message_id = ?", (message.id,))
-                    
-            await db.commit()
+                # Create new starboard message
+                self.logger.debug(f"⭐ Starboard: Creating new starboard message for {message.id} with {star_count} stars (threshold: {threshold})")
+                starboard_msg_id = await self.create_starboard_message(message, star_count, settings)
+                if starboard_msg_id:
+                    self.logger.debug(f"✅ Starboard: Created message {starboard_msg_id} in starboard channel")
+                    return _SQL_INSERT_STARRED, (
+                        message.id, message.guild.id, message.channel.id, message.author.id,
+                        starboard_msg_id, star_count, message.content or "", 
+                        json.dumps([att.url for att in message.attachments], separators=(",", ":")),
+                        current_time, current_time
+                    )
+                else:
+                    self.logger.error(f"❌ Starboard: Failed to create starboard message for {message.id}")
+        else:
+            if starboard_msg_id is not None:
+                # Remove from starboard if below threshold
+                await self.remove_starboard_message(starboard_msg_id, settings)
+                return "DELETE FROM starred_messages WHERE message_id = ?", (message.id,)
+        return None
             
     async def create_starboard_message(self, message: discord.Message, star_count: int, settings: Dict) -> Optional[int]:
         """Create a new starboard message"""
@@ -830,26 +1031,29 @@ class StarboardSystem(commands.Cog):
             return None
             
     async def update_starboard_message(self, message: discord.Message, star_count: int, 
-                                     starboard_msg_id: int, settings: Dict):
-        """Update an existing starboard message"""
+                                     starboard_msg_id: int, settings: Dict) -> EditResult:
+        """Update an existing starboard message.
+
+        Returns GONE if the starboard message no longer exists, so the caller can drop its row,
+        and FAILED if it couldn't be edited, so the caller keeps the count it last showed.
+        """
         if not message.guild:
-            return
+            return EditResult.FAILED
             
         starboard_channel = message.guild.get_channel(settings['channel_id'])
         if not starboard_channel or not isinstance(starboard_channel, discord.TextChannel):
-            return
+            return EditResult.FAILED
             
         try:
             starboard_msg = await starboard_channel.fetch_message(starboard_msg_id)
             embed = await self.create_starboard_embed(message, star_count, settings)
             await starboard_msg.edit(embed=embed)
         except discord.NotFound:
-            # Starboard message was deleted, remove from database
-            async with aiosqlite.connect(self.database_path) as db:
-                await db.execute("DELETE FROM starred_messages WHERE starboard_message_id = ?", (starboard_msg_id,))
-                await db.commit()
+            return EditResult.GONE
         except Exception as e:
             self.logger.exception(f"Error updating starboard message {starboard_msg_id} for original {message.id}")
+            return EditResult.FAILED
+        return EditResult.UPDATED
             
     async def remove_starboard_message(self, starboard_msg_id: int, settings: Dict):
         """Remove a starboard message"""
@@ -870,21 +1074,15 @@ class StarboardSystem(commands.Cog):
         star_emoji = settings.get('star_emoji', '⭐')
         # Keep the starboard embed compact: author, avatar, highlighted message, and jump link
         # Dynamic color retained for slight visual cue
-        if star_count >= 20:
-            color = 0xFFD700
-        elif star_count >= 10:
-            color = 0xFF6B6B
-        elif star_count >= 5:
-            color = 0x4ECDC4
-        else:
-            color = 0xF7DC6F
+        color = _TIER_COLORS[bisect.bisect_right(_TIER_THRESHOLDS, star_count)]
 
         content = message.content or "*No text content*"
         if len(content) > 1500:
             content = content[:1500] + "..."
 
         # Highlight the message by using a block quote style in the description
-        description = f"> {content.replace('\n', '\n> ')}"
+        quoted = content.replace('\n', '\n> ')
+        description = f"> {quoted}"
 
         embed = discord.Embed(
             description=description,
@@ -924,7 +1122,7 @@ class StarboardSystem(commands.Cog):
         if not ctx.guild:
             return
             
-        settings = await self.get_starboard_settings(ctx.guild.id)
+        settings = self._settings(ctx.guild.id)
         if not settings:
             embed = create_error_embed("Starboard not configured for this server")
             await ctx.send(embed=embed)
@@ -936,51 +1134,45 @@ class StarboardSystem(commands.Cog):
             # If we can't defer (older discord.py or missing interaction), continue silently
             pass
         
-        cleaned_count = 0
+        db = self.db
+        # Get all starred messages for this guild
+        cursor = await db.execute("""
+            SELECT message_id, channel_id, starboard_message_id 
+            FROM starred_messages 
+            WHERE guild_id = ?
+        """, (ctx.guild.id,))
         
-        async with aiosqlite.connect(self.database_path) as db:
-            # Get all starred messages for this guild
-            cursor = await db.execute("""
-                SELECT message_id, channel_id, starboard_message_id 
-                FROM starred_messages 
-                WHERE guild_id = ?
-            """, (ctx.guild.id,))
-            
-            entries = await cursor.fetchall()
-            
-            for message_id, channel_id, starboard_msg_id in entries:
-                should_clean = False
+        entries = await cursor.fetchall()
+        stale_ids = []
+        
+        # Resolve each channel once, not per entry; None marks one that is gone or not a text channel
+        starboard_channel = ctx.guild.get_channel(settings['channel_id'])
+        if not isinstance(starboard_channel, discord.TextChannel):
+            starboard_channel = None
+        channels = {}
+        for channel_id in {channel_id for _, channel_id, _ in entries}:
+            channel = ctx.guild.get_channel(channel_id)
+            channels[channel_id] = channel if isinstance(channel, discord.TextChannel) else None
+        
+        # Probe every entry concurrently; the semaphores keep a slow entry from holding up the
+        # rest while bounding how many requests hit Discord, overall and per channel
+        limits = (
+            asyncio.Semaphore(CLEANUP_MAX_IN_FLIGHT),
+            defaultdict(lambda: asyncio.Semaphore(CLEANUP_CHANNEL_CONCURRENCY)),
+        )
+        results = await asyncio.gather(*(
+            self._is_stale_entry(channels[channel_id], message_id, starboard_channel, starboard_msg_id, limits)
+            for message_id, channel_id, starboard_msg_id in entries
+        ))
+        stale_ids.extend((entry[0],) for entry, stale in zip(entries, results) if stale)
                 
-                # Check if original message exists
-                try:
-                    channel = ctx.guild.get_channel(channel_id)
-                    if not channel or not isinstance(channel, discord.TextChannel):
-                        should_clean = True
-                    else:
-                        await channel.fetch_message(message_id)
-                except discord.NotFound:
-                    should_clean = True
-                except:
-                    pass
-                    
-                # Check if starboard message exists
-                if not should_clean and starboard_msg_id:
-                    try:
-                        starboard_channel = ctx.guild.get_channel(settings['channel_id'])
-                        if starboard_channel and isinstance(starboard_channel, discord.TextChannel):
-                            await starboard_channel.fetch_message(starboard_msg_id)
-                    except discord.NotFound:
-                        should_clean = True
-                    except:
-                        pass
-                        
-                if should_clean:
-                    # Remove from database
-                    await db.execute("DELETE FROM starred_messages WHERE message_id = ?", (message_id,))
-                    await db.execute("DELETE FROM user_stars WHERE message_id = ?", (message_id,))
-                    cleaned_count += 1
-                    
-            await db.commit()
+        # Remove from database in one transaction once the Discord checks are done
+        if stale_ids:
+            async with self.write_lock:
+                await db.executemany("DELETE FROM starred_messages WHERE message_id = ?", stale_ids)
+                await db.executemany("DELETE FROM user_stars WHERE message_id = ?", stale_ids)
+                await db.commit()
+        cleaned_count = len(stale_ids)
             
         embed = discord.Embed(
             title=" Starboard Cleanup Complete",
@@ -997,6 +1189,40 @@ class StarboardSystem(commands.Cog):
             
         await ctx.send(embed=embed)
 
+    @staticmethod
+    async def _fetch_limited(channel: discord.TextChannel, message_id: int, limits: Tuple) -> discord.Message:
+        """fetch_message while holding the cleanup run's global and per-channel semaphores."""
+        total, per_channel = limits
+        async with total, per_channel[channel.id]:
+            return await channel.fetch_message(message_id)
+
+    async def _is_stale_entry(self, channel: Optional[discord.TextChannel], message_id: int,
+                              starboard_channel: Optional[discord.TextChannel],
+                              starboard_msg_id: Optional[int], limits: Tuple) -> bool:
+        """Whether a starred entry's original message or starboard post no longer exists.
+
+        `channel` is the original message's channel, None if it no longer exists.
+        """
+        # Check if original message exists
+        if channel is None:
+            return True
+        try:
+            await self._fetch_limited(channel, message_id, limits)
+        except discord.NotFound:
+            return True
+        except Exception:
+            pass
+            
+        # Check if starboard message exists
+        if starboard_msg_id and starboard_channel is not None:
+            try:
+                await self._fetch_limited(starboard_channel, starboard_msg_id, limits)
+            except discord.NotFound:
+                return True
+            except Exception:
+                pass
+        return False
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(StarboardSystem(bot))
\ No newline at end of file
@@ -5,7 +5,7 @@ Bet model for tracking game bets.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, Float, Integer, String, Text
+from sqlalchemy import BigInteger, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -15,9 +15,13 @@ class Bet(Base):
     """Represents a bet placed in a game."""
 
     __tablename__ = 'bets'
+    __table_args__ = (
+        # Covers per-user lookups, optionally over a time range
+        Index('ix_bets_user_time_amount', 'user_id', 'timestamp', 'amount'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(BigInteger, index=True)
+    user_id: Mapped[int] = mapped_column(BigInteger)
     game: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g., 'blackjack', 'roulette', 'slots'
     amount: Mapped[int] = mapped_column(Integer, nullable=False)
     bet_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # e.g., 'red', 'single:5', 'hit'
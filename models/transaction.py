@@ -5,7 +5,7 @@ Transaction model for tracking all economy transactions.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, Integer, String, Text
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -15,6 +15,8 @@ class Transaction(Base):
     """Represents a transaction in the economy."""
 
     __tablename__ = 'transactions'
+    # Amounts are signed (debits are negative), but a zero-amount row is always a bug
+    __table_args__ = (CheckConstraint('amount != 0', name='ck_transactions_amount_nonzero'),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(BigInteger, index=True)
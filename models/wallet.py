@@ -16,7 +16,7 @@ class Wallet(Base):
 
     __tablename__ = 'wallets'
 
-    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)  # Foreign key to User.id
+    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)  # Foreign key to User.id; the primary key index covers lookups
     balance: Mapped[int] = mapped_column(Integer, default=0)  # Wallet balance
     bank: Mapped[int] = mapped_column(Integer, default=0)  # Bank balance
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -25,3 +25,77 @@ class TestEconomyUtils:
         assert wallet.user_id == 123
         assert wallet.balance == 0
         assert wallet.bank == 0
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_wallet(self, session: AsyncSession):
+        """Test that a missing wallet is created once and then reused."""
+        wallet = await EconomyUtils.get_or_create_wallet(session, 123)
+        assert wallet.user_id == 123
+        assert wallet.balance == 0
+        assert wallet.bank == 0
+
+        assert await EconomyUtils.get_or_create_wallet(session, 123) is wallet
+
+    @pytest.mark.asyncio
+    async def test_apply_net(self, session: AsyncSession):
+        """Test applying a net balance change in place."""
+        assert await EconomyUtils.apply_net(session, 123, 50) is None
+
+        wallet = await EconomyUtils.create_wallet(session, 123)
+        updated = await EconomyUtils.apply_net(session, 123, 50)
+        assert updated is wallet
+        assert wallet.balance == 50
+
+        await EconomyUtils.apply_net(session, 123, -20)
+        assert wallet.balance == 30
+
+    @pytest.mark.asyncio
+    async def test_add_money_creates_wallet(self, session: AsyncSession):
+        """Test adding money to existing and missing wallets."""
+        assert await EconomyUtils.add_money(session, 123, 100, 'work')
+        wallet = await EconomyUtils.get_wallet(session, 123)
+        assert wallet.balance == 100
+
+        assert await EconomyUtils.add_money(session, 123, 25, 'work')
+        assert wallet.balance == 125
+
+    @pytest.mark.asyncio
+    async def test_try_debit(self, session: AsyncSession):
+        """Test that a debit only applies when the balance covers it."""
+        assert await EconomyUtils.try_debit(session, 123, 10) is None
+
+        wallet = await EconomyUtils.create_wallet(session, 123)
+        await EconomyUtils.apply_net(session, 123, 100)
+
+        assert await EconomyUtils.try_debit(session, 123, 150) is None
+        assert wallet.balance == 100
+
+        assert await EconomyUtils.try_debit(session, 123, 60) is wallet
+        assert wallet.balance == 40
+
+    @pytest.mark.asyncio
+    async def test_try_debit_with_payout(self, session: AsyncSession):
+        """Test settling a bet and its payout in one debit."""
+        wallet = await EconomyUtils.create_wallet(session, 123)
+        await EconomyUtils.apply_net(session, 123, 100)
+
+        # The balance check applies to the bet, not the net result
+        assert await EconomyUtils.try_debit(session, 123, 150, 300) is None
+
+        await EconomyUtils.try_debit(session, 123, 100, 200)
+        assert wallet.balance == 200
+
+    @pytest.mark.asyncio
+    async def test_transfer_money(self, session: AsyncSession):
+        """Test that a transfer moves coins only when the sender can cover it."""
+        await EconomyUtils.create_wallet(session, 123)
+        await EconomyUtils.apply_net(session, 123, 100)
+        await session.commit()
+
+        assert not await EconomyUtils.transfer_money(session, 123, 456, 150)
+        assert await EconomyUtils.transfer_money(session, 123, 456, 60)
+
+        sender = await EconomyUtils.get_wallet(session, 123)
+        receiver = await EconomyUtils.get_wallet(session, 456)
+        assert sender.balance == 40
+        assert receiver.balance == 60
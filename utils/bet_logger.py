@@ -0,0 +1,118 @@
+"""
+Batched writer for Bet analytics rows.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from models import Bet
+
+logger = logging.getLogger(__name__)
+
+
+class BetLogger:
+    """Queues Bet rows and writes them in multi-row INSERTs from a single background task.
+
+    Wallet updates stay synchronous in the game commands; only the analytics
+    write is deferred here.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        flush_interval: float = 0.05,
+        batch_size: int = 100,
+        maxsize: int = 10_000
+    ):
+        self.session_maker = session_maker
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        # None is the stop sentinel close() uses to wake a flusher idle on get()
+        self._queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue(maxsize=maxsize)
+        self._flusher: Optional[asyncio.Task] = None
+        # Set by close(); the flusher finishes its current batch and exits instead of being cancelled
+        self._closing = False
+
+    def start(self):
+        """Start the background flusher task."""
+        if self._flusher is None or self._flusher.done():
+            self._closing = False
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def submit(self, bet: Dict[str, Any]):
+        """Queue a Bet row (a dict of Bet column values) for insertion."""
+        await self._queue.put(bet)
+
+    async def record(
+        self,
+        *,
+        game: str,
+        user_id: int,
+        amount: int,
+        outcome: str,
+        payout: int,
+        bet_type: Optional[str] = None,
+        multiplier: Optional[float] = None
+    ):
+        """Queue a Bet row built from its fields.
+
+        Every row goes through here so batches share one column set.
+        """
+        await self.submit({
+            'user_id': user_id,
+            'game': game,
+            'amount': amount,
+            'bet_type': bet_type,
+            'multiplier': multiplier,
+            'outcome': outcome,
+            'payout': payout,
+        })
+
+    async def close(self):
+        """Stop the flusher and write anything still queued."""
+        if self._flusher is not None:
+            if not self._flusher.done():
+                # Cancelling mid-flush would drop a batch already taken off the queue
+                self._closing = True
+                await self._queue.put(None)
+                await self._flusher
+            self._flusher = None
+
+        while not self._queue.empty():
+            await self._write(self._drain())
+
+    def _drain(self, first: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Pop up to `batch_size` queued rows without waiting."""
+        rows = [first] if first is not None else []
+        while len(rows) < self.batch_size:
+            try:
+                row = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    async def _flush_loop(self):
+        while not self._closing:
+            first = await self._queue.get()
+            if first is None:
+                break
+            # Give concurrent games a moment to add to the batch
+            if not self._closing and self._queue.qsize() < self.batch_size - 1:
+                await asyncio.sleep(self.flush_interval)
+            await self._write(self._drain(first))
+
+    async def _write(self, rows: List[Dict[str, Any]]):
+        if not rows:
+            return
+        try:
+            async with self.session_maker() as session:
+                await session.execute(insert(Bet), rows)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} bet rows: {e}")
@@ -20,6 +20,15 @@ class Config(BaseSettings):
     topgg_webhook_secret: Optional[str] = Field(default=None)
     redis_url: Optional[str] = Field(default=None)
 
+    # Database connection pool
+    db_pool_size: int = Field(default=20)
+    db_max_overflow: int = Field(default=30)
+    db_pool_recycle: int = Field(default=3600)
+    # Compiled-statement cache entries kept by the engine (SQLAlchemy's default is 500)
+    db_query_cache_size: int = Field(default=1200)
+    # Server-side prepared statements kept per asyncpg connection (PostgreSQL only)
+    db_statement_cache_size: int = Field(default=1024)
+
     # Game settings
     min_bet: int = Field(default=10)
     max_bet: int = Field(default=10000)
@@ -31,6 +40,8 @@ class Config(BaseSettings):
     work_cooldown: int = Field(default=1800)
     daily_cooldown: int = Field(default=86400)
     weekly_cooldown: int = Field(default=604800)
+    # Roulette/slots bets below this get a one-line text reply instead of an embed (0 = always embed)
+    embed_threshold: int = Field(default=0)
 
     class Config:
         env_file = '.env'
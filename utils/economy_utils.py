@@ -3,36 +3,321 @@ Utility functions for economy operations.
 """
 
 import asyncio
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, event, insert, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from models import Transaction, Wallet
 from utils.config import Config
 
 
+# Hot wallet statements, built once at import so SQLAlchemy's compiled cache
+# and the driver's prepared statements are reused across calls.
+WALLET_APPLY_NET_STMT = (
+    update(Wallet)
+    .where(Wallet.user_id == bindparam('u'))
+    .values(balance=Wallet.balance + bindparam('d'))
+    .returning(Wallet)
+    .execution_options(populate_existing=True)
+)
+WALLET_DEBIT_STMT = (
+    update(Wallet)
+    .where(Wallet.user_id == bindparam('u'), Wallet.balance >= bindparam('a'))
+    .values(balance=Wallet.balance - bindparam('a') + bindparam('p'))
+    .returning(Wallet)
+    .execution_options(populate_existing=True)
+)
+
+# Plain column read for display; no ORM instance or identity-map entry is built
+WALLET_BALANCES_STMT = select(Wallet.balance, Wallet.bank).where(Wallet.user_id == bindparam('u'))
+
+# Ledger rows are written without RETURNING, so several rows go out as one executemany
+# instead of one INSERT per Transaction object
+TRANSACTION_INSERT_STMT = insert(Transaction)
+
+
+def _wallet_upsert(insert):
+    """Insert a default wallet, or return the existing row if another writer got there first."""
+    stmt = insert(Wallet).values(user_id=bindparam('u'))
+    return (
+        stmt.on_conflict_do_update(index_elements=[Wallet.user_id], set_={'user_id': stmt.excluded.user_id})
+        .returning(Wallet)
+        .execution_options(populate_existing=True)
+    )
+
+
+def _wallet_credit_upsert(insert):
+    """Add to a wallet's balance, creating the wallet with that balance if it doesn't exist."""
+    stmt = insert(Wallet).values(user_id=bindparam('u'), balance=bindparam('d'))
+    return (
+        stmt.on_conflict_do_update(
+            index_elements=[Wallet.user_id],
+            set_={'balance': Wallet.balance + stmt.excluded.balance, 'updated_at': stmt.excluded.updated_at}
+        )
+        .returning(Wallet)
+        .execution_options(populate_existing=True)
+    )
+
+
+# Keyed by dialect name; other backends fall back to create_wallet
+WALLET_UPSERT_STMTS = {
+    'sqlite': _wallet_upsert(sqlite_insert),
+    'postgresql': _wallet_upsert(pg_insert),
+}
+WALLET_CREDIT_STMTS = {
+    'sqlite': _wallet_credit_upsert(sqlite_insert),
+    'postgresql': _wallet_credit_upsert(pg_insert),
+}
+
+# Transaction-scoped locks on both users of a transfer, taken lowest id first, so
+# opposite transfers between the same pair queue instead of deadlocking on the
+# wallet rows. SQLite serializes writers already and needs none.
+TRANSFER_LOCK_STMTS = {
+    'postgresql': text("SELECT pg_advisory_xact_lock(:a), pg_advisory_xact_lock(:b)"),
+}
+
+# Profile reads are served from memory for a short while; a committed change to a
+# user's wallet or ledger drops their entry (see the session listeners below).
+PROFILE_CACHE_TTL = 30
+PROFILE_CACHE_SIZE = 4096
+# Balance reads get the same treatment, with a short TTL as a backstop for writes
+# made outside this process
+WALLET_CACHE_TTL = 2
+
+
+@dataclass(slots=True)
+class ProfileSnapshot:
+    """The numbers shown by the profile command, detached from any session."""
+
+    balance: int
+    bank: int
+    tx_count: int
+    total_earned: int
+
+
+@dataclass(slots=True)
+class WalletSnapshot:
+    """A wallet's balances, detached from any session, for read-only callers."""
+
+    balance: int
+    bank: int
+
+
+_profile_cache: Dict[int, Tuple[float, ProfileSnapshot]] = {}
+_wallet_cache: Dict[int, Tuple[float, WalletSnapshot]] = {}
+
+
+def _mark_profile_dirty(session, user_id: int):
+    """Remember that the session changed a user's economy rows."""
+    session.info.setdefault('profile_dirty', set()).add(user_id)
+
+
+def _cached_balance_short(session, user_id: int, amount: int) -> bool:
+    """Whether a fresh cached balance already shows the user can't cover `amount`.
+
+    The cache holds committed balances, so it is only trusted while this
+    session has no changes of its own.
+    """
+    cached = _wallet_cache.get(user_id)
+    if cached is None or time.monotonic() - cached[0] >= WALLET_CACHE_TTL:
+        return False
+    if session.info.get('profile_dirty') or session.new or session.dirty:
+        return False
+    return cached[1].balance < amount
+
+
+@event.listens_for(Session, 'before_flush')
+def _track_profile_changes(session, flush_context, instances):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (Wallet, Transaction)):
+            _mark_profile_dirty(session, obj.user_id)
+
+
+@event.listens_for(Session, 'after_commit')
+def _drop_committed_profiles(session):
+    # Drop entries only once the change is visible to other sessions, so a
+    # concurrent profile read can't cache the pre-commit numbers again
+    for user_id in session.info.pop('profile_dirty', ()):
+        _profile_cache.pop(user_id, None)
+        _wallet_cache.pop(user_id, None)
+
+
 class EconomyUtils:
     """Utility class for economy-related operations."""
 
     @staticmethod
     async def get_wallet(session: AsyncSession, user_id: int) -> Optional[Wallet]:
-        """Get a user's wallet."""
-        stmt = select(Wallet).where(Wallet.user_id == user_id)
-        result = await session.execute(stmt)
+        """Get a user's wallet.
+
+        Uses the session's identity map, so a wallet already loaded in this
+        session is returned without another SELECT.
+        """
+        return await session.get(Wallet, user_id)
+
+    @staticmethod
+    async def get_wallet_snapshot(session: AsyncSession, user_id: int) -> Optional[WalletSnapshot]:
+        """Get a user's balances for display, from memory if read in the last few seconds.
+
+        Returns None if the user has no wallet. Callers that change the wallet
+        should use get_wallet instead.
+        """
+        now = time.monotonic()
+        cached = _wallet_cache.get(user_id)
+        if cached is not None and now - cached[0] < WALLET_CACHE_TTL:
+            return cached[1]
+
+        row = (await session.execute(WALLET_BALANCES_STMT, {'u': user_id})).first()
+        if row is None:
+            return None
+        snapshot = WalletSnapshot(*row)
+        _wallet_cache.pop(user_id, None)
+        if len(_wallet_cache) >= PROFILE_CACHE_SIZE:
+            del _wallet_cache[next(iter(_wallet_cache))]
+        _wallet_cache[user_id] = (now, snapshot)
+        return snapshot
+
+    @staticmethod
+    async def apply_net(session: AsyncSession, user_id: int, net: int) -> Optional[Wallet]:
+        """Add `net` (may be negative) to a wallet's balance in one UPDATE.
+
+        Returns the refreshed wallet, or None if the user has no wallet.
+        """
+        result = await session.execute(WALLET_APPLY_NET_STMT, {'u': user_id, 'd': net})
+        _mark_profile_dirty(session, user_id)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def credit(session: AsyncSession, user_id: int, amount: int) -> Wallet:
+        """Add `amount` to a wallet's balance, creating the wallet if needed.
+
+        Existing and missing wallets both take a single upsert. Returns the
+        refreshed wallet.
+        """
+        upsert = WALLET_CREDIT_STMTS.get(session.get_bind().dialect.name)
+        if upsert is None:
+            wallet = await EconomyUtils.apply_net(session, user_id, amount)
+            if wallet is None:
+                wallet = await EconomyUtils.get_or_create_wallet(session, user_id)
+                wallet.balance += amount
+            return wallet
+
+        result = await session.execute(upsert, {'u': user_id, 'd': amount})
+        _mark_profile_dirty(session, user_id)
+        return result.scalar_one()
+
+    @staticmethod
+    async def try_debit(
+        session: AsyncSession,
+        user_id: int,
+        amount: int,
+        payout: int = 0
+    ) -> Optional[Wallet]:
+        """Debit `amount` only if the balance covers it, in one conditional UPDATE.
+
+        A known `payout` (e.g. an already-decided game result) is credited in the
+        same statement. Returns the refreshed wallet, or None if the user has no
+        wallet or too few coins.
+        """
+        # Repeated attempts by a user who is known to be short skip the round trip
+        if _cached_balance_short(session, user_id, amount):
+            return None
+        result = await session.execute(WALLET_DEBIT_STMT, {'u': user_id, 'a': amount, 'p': payout})
+        _mark_profile_dirty(session, user_id)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def record_transaction(
+        session: AsyncSession,
+        user_id: int,
+        amount: int,
+        type_: str,
+        description: str = "",
+        game: Optional[str] = None,
+        recipient_id: Optional[int] = None
+    ) -> Transaction:
+        """Add a ledger entry without touching the wallet."""
+        tx = Transaction(
+            user_id=user_id,
+            type=type_,
+            amount=amount,
+            description=description,
+            game=game,
+            recipient_id=recipient_id
+        )
+        session.add(tx)
+        return tx
+
+    @staticmethod
+    async def record_transactions(session: AsyncSession, rows: List[Dict[str, Any]]):
+        """Write several ledger entries in one batched INSERT.
+
+        Each row is a dict of Transaction column values. Unlike record_transaction
+        no ORM objects are built, so the rows can't be read back from the session.
+        """
+        if not rows:
+            return
+        await session.execute(TRANSACTION_INSERT_STMT, rows)
+        for row in rows:
+            _mark_profile_dirty(session, row['user_id'])
+
+    @staticmethod
+    def get_cached_profile(user_id: int) -> Optional[ProfileSnapshot]:
+        """Return a user's cached profile numbers if they are still fresh."""
+        cached = _profile_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < PROFILE_CACHE_TTL:
+            return cached[1]
+        return None
+
+    @staticmethod
+    def cache_profile(user_id: int, snapshot: ProfileSnapshot):
+        """Store a user's profile numbers, evicting the oldest entry when full."""
+        _profile_cache.pop(user_id, None)
+        if len(_profile_cache) >= PROFILE_CACHE_SIZE:
+            del _profile_cache[next(iter(_profile_cache))]
+        _profile_cache[user_id] = (time.monotonic(), snapshot)
+
+    @staticmethod
+    def invalidate_profile(user_id: Optional[int] = None):
+        """Drop one user's cached profile and balances, or every user's if no user is given.
+
+        ORM changes and the wallet UPDATE helpers invalidate automatically on commit;
+        this is for writes that bypass both, such as raw SQL.
+        """
+        if user_id is None:
+            _profile_cache.clear()
+            _wallet_cache.clear()
+        else:
+            _profile_cache.pop(user_id, None)
+            _wallet_cache.pop(user_id, None)
+
     @staticmethod
     async def create_wallet(session: AsyncSession, user_id: int) -> Wallet:
-        """Create a new wallet for a user."""
+        """Create a new wallet for a user, or return theirs if it already exists.
+
+        Uses one upsert that returns the row, so a concurrent creation for the
+        same user can't fail the call or leave the session unusable.
+        """
+        upsert = WALLET_UPSERT_STMTS.get(session.get_bind().dialect.name)
+        if upsert is not None:
+            result = await session.execute(upsert, {'u': user_id})
+            _mark_profile_dirty(session, user_id)
+            return result.scalar_one()
+
+        # No upsert on this backend: insert under a savepoint so a duplicate
+        # only rolls back the insert, then load the existing wallet
         wallet = Wallet(user_id=user_id)
-        session.add(wallet)
-        # Flush so that defaults declared in the model are applied and available on the instance
         try:
-            await session.flush()
-        except Exception:
-            # If flush fails for any reason, ignore here; calling code/tests can handle commit
-            pass
+            async with session.begin_nested():
+                session.add(wallet)
+        except IntegrityError:
+            wallet = await EconomyUtils.get_wallet(session, user_id)
         return wallet
 
     @staticmethod
@@ -41,13 +326,6 @@ class EconomyUtils:
         wallet = await EconomyUtils.get_wallet(session, user_id)
         if wallet is None:
             wallet = await EconomyUtils.create_wallet(session, user_id)
-            # Flush to ensure defaults are applied
-            await session.flush()
-            # Ensure default values are set
-            if wallet.balance is None:
-                wallet.balance = 0
-            if wallet.bank is None:
-                wallet.bank = 0
         return wallet
 
     @staticmethod
@@ -58,43 +336,35 @@ class EconomyUtils:
         amount: int,
         description: str = ""
     ) -> bool:
-        """Transfer money between users atomically."""
+        """Transfer money between users.
+
+        Runs in the caller's transaction, which the caller commits (or rolls back),
+        so a transfer can be committed together with other writes. Nothing is
+        written when the sender can't cover the amount.
+        """
         if amount <= 0:
             return False
 
-        # Use a transaction for atomicity
-        async with session.begin():
-            # Get sender wallet
-            sender_wallet = await EconomyUtils.get_wallet(session, from_user_id)
-            if sender_wallet is None or sender_wallet.balance < amount:
-                return False
-
-            # Get or create receiver wallet
-            receiver_wallet = await EconomyUtils.get_or_create_wallet(session, to_user_id)
-
-            # Update balances
-            sender_wallet.balance -= amount
-            receiver_wallet.balance += amount
-
-            # Record transactions
-            sender_tx = Transaction(
-                user_id=from_user_id,
-                type='transfer_out',
-                amount=-amount,
-                description=description,
-                recipient_id=to_user_id
-            )
-            receiver_tx = Transaction(
-                user_id=to_user_id,
-                type='transfer_in',
-                amount=amount,
-                description=description,
-                recipient_id=from_user_id
-            )
-
-            session.add(sender_tx)
-            session.add(receiver_tx)
+        lock = TRANSFER_LOCK_STMTS.get(session.get_bind().dialect.name)
+        if lock is not None:
+            low, high = sorted((from_user_id, to_user_id))
+            await session.execute(lock, {'a': low, 'b': high})
+
+        # The balance check and debit are one conditional UPDATE, so two
+        # concurrent transfers can't both spend the same coins
+        if await EconomyUtils.try_debit(session, from_user_id, amount) is None:
+            return False
+
+        # Credit the receiver, creating their wallet if needed, in one statement
+        await EconomyUtils.credit(session, to_user_id, amount)
 
+        # Record both sides of the transfer in one INSERT
+        await EconomyUtils.record_transactions(session, [
+            {'user_id': from_user_id, 'type': 'transfer_out', 'amount': -amount,
+             'description': description, 'recipient_id': to_user_id},
+            {'user_id': to_user_id, 'type': 'transfer_in', 'amount': amount,
+             'description': description, 'recipient_id': from_user_id},
+        ])
         return True
 
     @staticmethod
@@ -106,22 +376,13 @@ class EconomyUtils:
         description: str = "",
         game: Optional[str] = None
     ) -> bool:
-        """Add money to a user's wallet."""
-        if amount < 0:
+        """Add money to a user's wallet. Non-positive amounts are rejected."""
+        if amount <= 0:
             return False
 
-        wallet = await EconomyUtils.get_or_create_wallet(session, user_id)
-        wallet.balance += amount
-
-        tx = Transaction(
-            user_id=user_id,
-            type=type_,
-            amount=amount,
-            description=description,
-            game=game
-        )
-        session.add(tx)
+        await EconomyUtils.credit(session, user_id, amount)
 
+        EconomyUtils.record_transaction(session, user_id, amount, type_, description, game)
         return True
 
     @staticmethod
@@ -133,25 +394,15 @@ class EconomyUtils:
         description: str = "",
         game: Optional[str] = None
     ) -> bool:
-        """Subtract money from a user's wallet."""
-        if amount < 0:
+        """Subtract money from a user's wallet. Non-positive amounts are rejected."""
+        if amount <= 0:
             return False
 
-        wallet = await EconomyUtils.get_wallet(session, user_id)
-        if wallet is None or wallet.balance < amount:
+        wallet = await EconomyUtils.try_debit(session, user_id, amount)
+        if wallet is None:
             return False
 
-        wallet.balance -= amount
-
-        tx = Transaction(
-            user_id=user_id,
-            type=type_,
-            amount=-amount,
-            description=description,
-            game=game
-        )
-        session.add(tx)
-
+        EconomyUtils.record_transaction(session, user_id, -amount, type_, description, game)
         return True
 
     @staticmethod
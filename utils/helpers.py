@@ -3,6 +3,7 @@ Helper utilities for the bot.
 """
 
 import random
+from functools import lru_cache
 from typing import Any, List, Optional
 
 import discord
@@ -81,21 +82,25 @@ class RNG:
         return choices[-1][0]  # Fallback
 
 
+@lru_cache(maxsize=4096)
 def format_coins(amount: int) -> str:
-    """Format coin amount with commas."""
+    """Format coin amount with commas. Cached, since repeat bets format the same amounts."""
     if amount is None:
         amount = 0
     return f"{amount:,} coins"
 
 
+RESPONSIBLE_GAMING_NOTICE = (
+    "🎲 **Responsible Gaming Notice**\n"
+    "Gambling can be addictive. Please play responsibly.\n"
+    "If you need help, contact a professional or visit gamblinghelponline.org.au\n"
+    "This bot is for entertainment purposes only."
+)
+
+
 def responsible_gaming_notice() -> str:
     """Return responsible gaming notice."""
-    return (
-        "🎲 **Responsible Gaming Notice**\n"
-        "Gambling can be addictive. Please play responsibly.\n"
-        "If you need help, contact a professional or visit gamblinghelponline.org.au\n"
-        "This bot is for entertainment purposes only."
-    )
+    return RESPONSIBLE_GAMING_NOTICE
 
 
 def validate_age(user: discord.User) -> bool: